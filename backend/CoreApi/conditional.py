@@ -0,0 +1,81 @@
+# CoreApi/conditional.py
+"""
+Conditional GET for DRF views.
+
+A view lists the cheap inputs its payload depends on (``updated_at``
+columns, counters, cache versions) in ``get_validators``. They are
+checked right after authentication, before the object is loaded or
+serialized, and a matching ``If-None-Match`` / ``If-Modified-Since``
+short-circuits the request with ``304 Not Modified``.
+"""
+
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.exceptions import APIException
+
+
+class NotModified(APIException):
+    status_code = 304
+
+    def __init__(self, response):
+        self.response = response
+
+
+class ConditionalGetMixin:
+    """
+    Mix into an APIView and implement ``get_validators``.
+    """
+
+    def get_validators(self, request, *args, **kwargs):
+        """
+        Return ``(etag_parts, last_modified)``: an iterable of values the
+        payload depends on (or None) and an aware datetime (or None).
+        """
+        raise NotImplementedError
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+
+        self._etag = self._last_modified = None
+        if request.method not in ("GET", "HEAD"):
+            return
+
+        parts, last_modified = self.get_validators(request, *args, **kwargs)
+
+        if parts is not None:
+            digest = hashlib.md5(
+                "|".join(map(str, parts)).encode(), usedforsecurity=False
+            ).hexdigest()
+            # Weak: equal payloads, not byte-identical renderings
+            self._etag = "W/" + quote_etag(digest)
+
+        if last_modified is not None:
+            self._last_modified = int(last_modified.timestamp())
+
+        response = get_conditional_response(
+            request,
+            etag=self._etag,
+            last_modified=self._last_modified,
+        )
+        if response is not None:
+            raise NotModified(self._set_validators(response))
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if response.status_code == 200:
+            self._set_validators(response)
+        return response
+
+    def _set_validators(self, response):
+        if getattr(self, "_etag", None):
+            response.headers["ETag"] = self._etag
+        if getattr(self, "_last_modified", None) is not None:
+            response.headers["Last-Modified"] = http_date(self._last_modified)
+        return response
@@ -0,0 +1,26 @@
+# CoreApi/locks.py
+"""
+Non-blocking Redis locks for rebuilds and periodic jobs.
+"""
+
+from contextlib import contextmanager
+
+from django_redis import get_redis_connection
+
+
+@contextmanager
+def redis_lock(key, timeout):
+    """
+    Try to take the lock at ``key`` without waiting; yields whether it
+    was acquired and releases it on exit. ``timeout`` (seconds) frees
+    the lock if the holder dies.
+    """
+    lock = get_redis_connection("default").lock(key, timeout=timeout)
+    if not lock.acquire(blocking=False):
+        yield False
+        return
+
+    try:
+        yield True
+    finally:
+        lock.release()
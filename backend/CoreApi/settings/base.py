@@ -50,6 +50,7 @@ INSTALLED_APPS = [
     "review",
     "blog",
     "contact",
+    "analytics",
     "tinymce",
 ]
 
@@ -163,6 +164,19 @@ REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "auth_app.authentication.JWTAuthenticationFromCookie",
     ),
+    # Proxies in front of Django (nginx); the client address is the
+    # X-Forwarded-For entry the outermost one of them appended
+    "NUM_PROXIES": int(os.environ.get("NUM_PROXIES", 1)),
+}
+
+# Per-endpoint limits enforced by CoreApi.throttling.RateLimitThrottle,
+# keyed by the view's throttle_scope, then by client scope (ip/user)
+RATE_LIMITS = {
+    "login": {"ip": "10/min"},
+    "register": {"ip": "5/hour"},
+    "forgot-password": {"ip": "5/hour"},
+    "contact": {"ip": "5/hour", "user": "5/hour"},
+    "company-suggestion": {"ip": "5/hour"},
 }
 
 SIMPLE_JWT = {
@@ -177,6 +191,10 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
 }
 
+# Access tokens carry the user's identity and company roles, so
+# authenticated requests don't load the user (see auth_app.tokens)
+JWT_STATELESS_AUTH = os.environ.get("JWT_STATELESS_AUTH", "False") == "True"
+
 # --------------------------------------------------
 # Redis Cache + Sessions
 # --------------------------------------------------
@@ -201,6 +219,39 @@ CELERY_BROKER_URL = os.environ.get("CELERY_BROKER_URL")
 CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 
+CELERY_BEAT_SCHEDULE = {
+    "flush-view-counters": {
+        "task": "analytics.tasks.flush_view_counters",
+        "schedule": timedelta(
+            seconds=int(os.environ.get("VIEW_COUNTER_FLUSH_SECONDS", 60))
+        ),
+    },
+    "rebuild-company-ranking": {
+        "task": "company.tasks.rebuild_company_ranking",
+        "schedule": timedelta(
+            seconds=int(os.environ.get("COMPANY_RANKING_REBUILD_SECONDS", 3600))
+        ),
+    },
+    "rebuild-autocomplete-index": {
+        "task": "content.tasks.rebuild_autocomplete",
+        "schedule": timedelta(
+            seconds=int(os.environ.get("AUTOCOMPLETE_REBUILD_SECONDS", 3600))
+        ),
+    },
+    "reindex-search-vectors": {
+        "task": "content.tasks.reindex_search_vectors",
+        "schedule": timedelta(
+            seconds=int(os.environ.get("SEARCH_REINDEX_SECONDS", 30))
+        ),
+    },
+    "build-sitemaps": {
+        "task": "content.tasks.build_sitemaps",
+        "schedule": timedelta(
+            seconds=int(os.environ.get("SITEMAP_BUILD_SECONDS", 3600))
+        ),
+    },
+}
+
 # --------------------------------------------------
 # Frontend
 # --------------------------------------------------
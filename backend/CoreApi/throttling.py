@@ -0,0 +1,125 @@
+# CoreApi/throttling.py
+"""
+Redis sliding-window rate limiting for DRF views.
+
+A view adds ``RateLimitThrottle`` to ``throttle_classes`` and names its
+policy in ``throttle_scope``; the ``RATE_LIMITS`` setting maps each
+scope to limits per client scope, e.g. ``{"login": {"ip": "10/min"}}``.
+
+Each limit is a sliding-window counter: one Redis counter per fixed
+window, with the previous window's count weighted by how much of it
+still overlaps the sliding window. All limits of a request are checked
+and counted in one Lua call, and only requests that pass every limit are
+counted, so a client hammering an endpoint can't lock itself out for
+longer than the window. Throttles run before the handler, so rejected
+requests never reach Postgres.
+"""
+
+import time
+
+from django.conf import settings
+from django_redis import get_redis_connection
+from rest_framework.throttling import BaseThrottle
+
+RATE_LIMIT_PREFIX = "ratelimit"
+
+_PERIODS = {"s": 1, "m": 60, "h": 60 * 60, "d": 60 * 60 * 24}
+
+# KEYS: one counter prefix per limit
+# ARGV: now, then (limit, window seconds) per key
+# Returns -1 if the request is allowed, else seconds to wait
+_SLIDING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local counters = {}
+for i = 1, #KEYS do
+    local limit = tonumber(ARGV[i * 2])
+    local window = tonumber(ARGV[i * 2 + 1])
+    local current = math.floor(now / window)
+    local elapsed = now - current * window
+
+    local key = KEYS[i] .. ':' .. current
+    local count = tonumber(redis.call('GET', key) or '0')
+    local previous = tonumber(
+        redis.call('GET', KEYS[i] .. ':' .. (current - 1)) or '0'
+    )
+
+    if previous * (1 - elapsed / window) + count + 1 > limit then
+        local wait
+        if count + 1 <= limit then
+            -- Until enough of the previous window has slid out
+            wait = (1 - (limit - count - 1) / previous) * window - elapsed
+        else
+            wait = window - elapsed
+        end
+        return math.max(1, math.ceil(wait))
+    end
+    counters[i] = key
+end
+for i = 1, #KEYS do
+    redis.call('INCR', counters[i])
+    redis.call('EXPIRE', counters[i], tonumber(ARGV[i * 2 + 1]) * 2)
+end
+return -1
+"""
+
+
+def parse_rate(rate):
+    """
+    ``"5/hour"`` -> ``(5, 3600)``. Periods are s, m, h and d, and may be
+    spelled out.
+    """
+    count, period = rate.split("/")
+    return int(count), _PERIODS[period.strip()[0]]
+
+
+def get_client_ip(request):
+    """
+    Client address, trusting only the ``X-Forwarded-For`` entries added
+    by our own proxies (``NUM_PROXIES`` in ``REST_FRAMEWORK``); entries
+    further left are client-supplied and easy to spoof.
+    """
+    return BaseThrottle().get_ident(request)
+
+
+def get_rate_limits(scope):
+    return getattr(settings, "RATE_LIMITS", {}).get(scope, {})
+
+
+class RateLimitThrottle(BaseThrottle):
+    """
+    Enforces ``RATE_LIMITS[view.throttle_scope]``. Supported client
+    scopes are ``ip`` (every request) and ``user`` (authenticated
+    requests only).
+    """
+
+    def allow_request(self, request, view):
+        scope = getattr(view, "throttle_scope", None)
+
+        keys = []
+        args = []
+        for client_scope, rate in get_rate_limits(scope).items():
+            ident = self.get_client_ident(request, client_scope)
+            if ident is None:
+                continue
+
+            count, window = parse_rate(rate)
+            keys.append(f"{RATE_LIMIT_PREFIX}:{scope}:{client_scope}:{ident}")
+            args += [count, window]
+
+        if not keys:
+            return True
+
+        self.retry_after = get_redis_connection("default").eval(
+            _SLIDING_WINDOW_SCRIPT, len(keys), *keys, time.time(), *args
+        )
+        return self.retry_after < 0
+
+    def get_client_ident(self, request, client_scope):
+        if client_scope == "ip":
+            return get_client_ip(request)
+        if client_scope == "user":
+            return request.user.pk if request.user.is_authenticated else None
+        raise ValueError(f"Unknown rate limit scope: {client_scope}")
+
+    def wait(self):
+        return self.retry_after
@@ -0,0 +1,93 @@
+# CoreApi/tracking.py
+"""
+Field change tracking for model signals.
+
+``on_fields_changed(model, fields)`` registers a handler that runs after
+a save that changed any of ``fields``. Per model there is one
+``post_init`` receiver, which keeps the loaded values of every tracked
+field, and one ``post_save`` receiver, which calls the handlers and then
+refreshes those values, so a second save of the same instance is
+compared against the first rather than against the load.
+
+Fields deferred at load time have no known old value; a save then always
+counts as a change and the handler gets ``old=None``.
+"""
+
+from collections import defaultdict
+
+from django.db.models.fields.files import FieldFile
+from django.db.models.signals import post_init, post_save
+
+# model -> set of tracked fields
+_fields = defaultdict(set)
+
+# model -> [(fields, handler)]
+_handlers = defaultdict(list)
+
+
+def _value(value):
+    # FieldFile is mutable and compares by name; keep the name
+    return value.name if isinstance(value, FieldFile) else value
+
+
+def get_loaded_values(instance, fields):
+    """
+    ``{field: value}`` as loaded (or as of the last save), or None when
+    some of ``fields`` were deferred.
+    """
+    loaded = instance.__dict__.get("_tracked_values", {})
+    if any(field not in loaded for field in fields):
+        return None
+    return {field: loaded[field] for field in fields}
+
+
+def _remember(sender, instance, **kwargs):
+    values = instance.__dict__
+    instance._tracked_values = {
+        field: _value(values[field])
+        for field in _fields[sender]
+        if field in values
+    }
+
+
+def _dispatch(sender, instance, created, **kwargs):
+    current = instance.__dict__
+
+    for fields, handler in _handlers[sender]:
+        old = None if created else get_loaded_values(instance, fields)
+
+        if (
+            old is None
+            or any(field not in current for field in fields)
+            or any(old[field] != _value(current[field]) for field in fields)
+        ):
+            handler(instance, old=old, created=created)
+
+    _remember(sender, instance)
+
+
+def track_fields(model, fields):
+    """
+    Keep the loaded values of ``fields`` for ``get_loaded_values``.
+    """
+    if model not in _fields:
+        uid = f"tracking:{model._meta.label_lower}"
+        post_init.connect(_remember, sender=model, weak=False, dispatch_uid=uid)
+        post_save.connect(_dispatch, sender=model, weak=False, dispatch_uid=uid)
+    _fields[model].update(fields)
+
+
+def on_fields_changed(model, fields):
+    """
+    Decorator: call ``handler(instance, old, created)`` after saves of
+    ``model`` that change any of ``fields``. ``old`` maps the fields to
+    their previous values, or is None for creates and unknown values.
+    """
+    fields = tuple(fields)
+
+    def register(handler):
+        track_fields(model, fields)
+        _handlers[model].append((fields, handler))
+        return handler
+
+    return register
@@ -0,0 +1,29 @@
+# CoreApi/versioning.py
+"""
+Versioned cache keys.
+
+A cached value is stored under a key that embeds a version read from the
+cache; bumping the version makes every entry built on the old one
+unreachable at once, and the orphans expire on their own TTL.
+"""
+
+import time
+
+from django.core.cache import cache
+
+
+def get_version(key):
+    """
+    Current version stored at ``key``, created on first use.
+    """
+    version = cache.get(key)
+    if version is None:
+        version = time.time_ns()
+        cache.set(key, version, None)
+    return version
+
+
+def bump_versions(keys):
+    # A fresh timestamp can never collide with a version that was evicted
+    version = time.time_ns()
+    cache.set_many({key: version for key in keys}, None)
@@ -0,0 +1,187 @@
+# analytics/counters.py
+"""
+Buffered view counters.
+
+Detail views only talk to Redis. Unique viewers are tracked in one
+HyperLogLog per object per UTC day (PFADD), so memory per object stays
+at ~12 KB per day no matter how much traffic it gets. Raw hits go into a
+per-model daily hash, and the ``(object, day)`` pair is marked dirty.
+
+A periodic Celery task turns the dirty HyperLogLogs into ``view_count``
+increments: the increment is the PFCOUNT growth since the count last
+flushed for that object and day, applied with one bulk UPDATE per model,
+so the request hot path never writes to Postgres. PFADD's return value
+is not used to detect new viewers; once a HyperLogLog is large most new
+elements don't change its registers and would be dropped.
+"""
+
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import BigIntegerField, Case, F, Value, When
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+from CoreApi.locks import redis_lock
+from CoreApi.throttling import get_client_ip
+
+# Models with a ``view_count`` column fed by the buffer
+COUNTED_MODELS = (
+    "company.company",
+    "blog.blogpost",
+)
+
+FLUSH_BATCH_SIZE = 500
+
+
+def get_redis():
+    return get_redis_connection("default")
+
+
+def _key(*parts):
+    prefix = getattr(settings, "VIEW_COUNTER_PREFIX", "views")
+    return ":".join([prefix, *map(str, parts)])
+
+
+def get_viewer_id(request):
+    """
+    Identify viewer (user-id preferred, fallback to IP)
+    """
+    if request.user.is_authenticated:
+        return f"user:{request.user.id}"
+
+    # REMOTE_ADDR is the proxy's address behind nginx
+    ip = get_client_ip(request) or "unknown"
+    return f"ip:{ip}"
+
+
+def get_stats_retention_days():
+    return getattr(settings, "VIEW_STATS_RETENTION_DAYS", 90)
+
+
+def _day(date):
+    return date.strftime("%Y%m%d")
+
+
+def record_view(request, model, pk):
+    """
+    Count a view of the ``model`` row ``pk`` once per viewer per UTC day.
+    Takes the pk rather than an instance so views can count before (or
+    without) loading the object.
+    """
+    label = model._meta.label_lower
+    day = _day(timezone.now())
+    ttl = get_stats_retention_days() * 24 * 60 * 60
+
+    uv_key = _key("uv", label, pk, day)
+    hits_key = _key("hits", label, day)
+
+    pipe = get_redis().pipeline(transaction=False)
+    pipe.pfadd(uv_key, get_viewer_id(request))
+    pipe.expire(uv_key, ttl)
+    pipe.hincrby(hits_key, pk, 1)
+    pipe.expire(hits_key, ttl)
+    pipe.sadd(_key("dirty", label), f"{pk}:{day}")
+    pipe.execute()
+
+
+def get_view_stats(obj, days=30):
+    """
+    Daily unique-viewer and total-view counts for ``obj``, oldest first.
+    Unique counts are HyperLogLog estimates (~0.8% standard error).
+    """
+    label = obj._meta.label_lower
+    days = max(1, min(days, get_stats_retention_days()))
+    today = timezone.now().date()
+    dates = [today - timedelta(days=offset) for offset in range(days - 1, -1, -1)]
+
+    pipe = get_redis().pipeline(transaction=False)
+    for date in dates:
+        pipe.pfcount(_key("uv", label, obj.pk, _day(date)))
+        pipe.hget(_key("hits", label, _day(date)), obj.pk)
+    values = pipe.execute()
+
+    return [
+        {
+            "date": date.isoformat(),
+            "unique_viewers": int(values[i * 2] or 0),
+            "total_views": int(values[i * 2 + 1] or 0),
+        }
+        for i, date in enumerate(dates)
+    ]
+
+
+def flush_view_counts(label):
+    """
+    Move the unique-viewer growth of one model's dirty HyperLogLogs into
+    Postgres. Returns the number of rows updated.
+    """
+    conn = get_redis()
+    dirty_key = _key("dirty", label)
+    flushing_key = _key("flushing", label)
+
+    # A leftover flushing set means the previous flush died before it
+    # finished; redo it before taking new entries.
+    if not conn.exists(flushing_key):
+        if not conn.exists(dirty_key):
+            return 0
+        conn.rename(dirty_key, flushing_key)
+
+    members = sorted(member.decode() for member in conn.smembers(flushing_key))
+    entries = [member.split(":") for member in members]
+
+    pipe = conn.pipeline(transaction=False)
+    for pk, day in entries:
+        pipe.pfcount(_key("uv", label, pk, day))
+        pipe.hget(_key("flushed", label, day), pk)
+    values = pipe.execute()
+
+    increments = {}
+    flushed = {}
+    for i, (pk, day) in enumerate(entries):
+        count = int(values[i * 2] or 0)
+        previous = int(values[i * 2 + 1] or 0)
+        # Estimates can wobble; never count a viewer twice
+        if count > previous:
+            increments[int(pk)] = increments.get(int(pk), 0) + count - previous
+            flushed.setdefault(day, {})[pk] = count
+
+    counts = sorted(increments.items())
+    model = apps.get_model(label)
+
+    ttl = get_stats_retention_days() * 24 * 60 * 60
+
+    with transaction.atomic():
+        for start in range(0, len(counts), FLUSH_BATCH_SIZE):
+            batch = counts[start : start + FLUSH_BATCH_SIZE]
+
+            model.objects.filter(pk__in=[pk for pk, _ in batch]).update(
+                view_count=F("view_count")
+                + Case(
+                    *[When(pk=pk, then=Value(n)) for pk, n in batch],
+                    default=Value(0),
+                    output_field=BigIntegerField(),
+                )
+            )
+
+        # Recorded before the commit: if we die in between, a redo finds
+        # nothing new and the increments are lost, never applied twice.
+        # If this write fails the UPDATE rolls back.
+        pipe = conn.pipeline(transaction=False)
+        for day, mapping in flushed.items():
+            pipe.hset(_key("flushed", label, day), mapping=mapping)
+            pipe.expire(_key("flushed", label, day), ttl)
+        pipe.execute()
+
+    conn.delete(flushing_key)
+
+    return len(counts)
+
+
+def flush_all_view_counts():
+    with redis_lock(_key("flush-lock"), timeout=300) as acquired:
+        if not acquired:
+            return {}
+        return {label: flush_view_counts(label) for label in COUNTED_MODELS}
@@ -0,0 +1,92 @@
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIRequestFactory
+
+from analytics.counters import get_redis, get_view_stats
+from blog.models import BlogPost
+from blog.views import BlogPostDetailView
+from company.models import Company
+from company.views import CompanyDetailView
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay first-time detail views against the company/blog detail "
+        "endpoints and report how many Postgres writes the hot path makes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=1000)
+        parser.add_argument(
+            "--target",
+            choices=["company", "blog"],
+            default="company",
+        )
+        parser.add_argument("--slug", help="Object to hit (default: first one)")
+
+    def handle(self, *args, **options):
+        if options["target"] == "company":
+            qs = Company.objects.filter(is_active=True)
+            view = CompanyDetailView.as_view()
+            path = "/api/company/{}/"
+        else:
+            qs = BlogPost.objects.filter(status=BlogPost.Status.PUBLISHED)
+            view = BlogPostDetailView.as_view()
+            path = "/api/blog/{}/"
+
+        if options["slug"]:
+            qs = qs.filter(slug=options["slug"])
+
+        obj = qs.first()
+        if obj is None:
+            raise CommandError("No object found to benchmark against")
+
+        # Keep synthetic views out of the real counters
+        prefix = f"bench-views:{uuid.uuid4().hex}"
+        factory = APIRequestFactory()
+        total = options["requests"]
+
+        try:
+            with override_settings(VIEW_COUNTER_PREFIX=prefix):
+                with CaptureQueriesContext(connection) as ctx:
+                    started = time.perf_counter()
+                    for i in range(total):
+                        request = factory.get(
+                            path.format(obj.slug),
+                            REMOTE_ADDR=f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}",
+                        )
+                        response = view(request, slug=obj.slug)
+                        if response.status_code != 200:
+                            raise CommandError(
+                                f"Unexpected status {response.status_code}"
+                            )
+                    elapsed = time.perf_counter() - started
+
+                writes = [
+                    q["sql"]
+                    for q in ctx.captured_queries
+                    if not q["sql"].lstrip().upper().startswith("SELECT")
+                ]
+
+                viewers = get_view_stats(obj, days=1)[-1]["unique_viewers"]
+        finally:
+            conn = get_redis()
+            for key in conn.scan_iter(match=f"{prefix}:*"):
+                conn.delete(key)
+
+        self.stdout.write(f"target:            {obj._meta.label_lower} #{obj.pk}")
+        self.stdout.write(f"requests:          {total}")
+        self.stdout.write(f"unique viewers:    {viewers}")
+        self.stdout.write(f"total queries:     {len(ctx.captured_queries)}")
+        self.stdout.write(f"postgres writes:   {len(writes)}")
+        self.stdout.write(f"avg latency:       {elapsed / total * 1000:.3f} ms")
+
+        if writes:
+            raise CommandError(f"Hot path wrote to Postgres: {writes[0]}")
+
+        self.stdout.write(self.style.SUCCESS("Hot path made zero Postgres writes"))
+
@@ -0,0 +1,36 @@
+# analytics/mixins.py
+from CoreApi.conditional import NotModified
+
+from .counters import record_view
+
+
+class RecordViewMixin:
+    """
+    Count a view of a detail page once the request is past
+    authentication and any conditional-GET check, so revalidated (304)
+    requests count too. Views implement ``get_viewed_pk`` and set
+    ``viewed_model``.
+    """
+
+    viewed_model = None
+
+    def get_viewed_pk(self, request, *args, **kwargs):
+        raise NotImplementedError
+
+    def initial(self, request, *args, **kwargs):
+        try:
+            super().initial(request, *args, **kwargs)
+        except NotModified:
+            self.record_view(request, *args, **kwargs)
+            raise
+
+        self.record_view(request, *args, **kwargs)
+
+    def record_view(self, request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            return
+
+        pk = self.get_viewed_pk(request, *args, **kwargs)
+        if pk is not None:
+            # Buffered in Redis, flushed to view_count by a periodic task
+            record_view(request, self.viewed_model, pk)
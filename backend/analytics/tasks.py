@@ -0,0 +1,8 @@
+from celery import shared_task
+
+from analytics.counters import flush_all_view_counts
+
+
+@shared_task
+def flush_view_counters():
+    return flush_all_view_counts()
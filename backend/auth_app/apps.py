@@ -5,3 +5,6 @@ class AuthAppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "auth_app"
     label = "auth_app"
+
+    def ready(self):
+        import auth_app.signals
@@ -1,5 +1,9 @@
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .tokens import user_from_token
+from .user_cache import get_cached_user
 
 
 class JWTAuthenticationFromCookie(JWTAuthentication):
@@ -13,5 +17,16 @@ class JWTAuthenticationFromCookie(JWTAuthentication):
         except InvalidToken:
             return None
 
-        user = self.get_user(validated_token)
+        # Stateless mode: no user query while the token's claims are current
+        user = user_from_token(validated_token) or self.get_user(validated_token)
         return (user, validated_token)
+
+    def get_user(self, validated_token):
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        user = get_cached_user(user_id) if user_id is not None else None
+
+        if user is None or not user.is_active:
+            # Let simplejwt raise the usual errors
+            return super().get_user(validated_token)
+
+        return user
@@ -0,0 +1,23 @@
+# auth_app/signals.py
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from company.models import CompanyMembership
+
+from .user_cache import bump_user_versions
+
+User = get_user_model()
+
+
+# ------------------------------------
+# Cached users and token claims
+# ------------------------------------
+@receiver([post_save, post_delete], sender=User)
+def on_user_change(sender, instance, **kwargs):
+    bump_user_versions([instance.pk])
+
+
+@receiver([post_save, post_delete], sender=CompanyMembership)
+def on_membership_change(sender, instance, **kwargs):
+    bump_user_versions([instance.user_id])
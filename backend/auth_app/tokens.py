@@ -0,0 +1,101 @@
+# auth_app/tokens.py
+"""
+Access tokens with identity and company role claims.
+
+With ``JWT_STATELESS_AUTH`` enabled, access tokens carry the user's id,
+username, email, mobile number and a compact list of
+``[company_id, slug, name, role]`` memberships, so authentication and
+``MeView`` need no database queries. Every token also records the
+user's version (``auth_app.user_cache``); saving the user or one of
+their memberships bumps it, which makes outstanding access tokens stale
+and sends the client back to the regular lookup until its next
+``/refresh/`` picks up the new claims.
+"""
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.settings import api_settings
+
+from company.models import CompanyMembership
+
+from .user_cache import get_user_version
+
+User = get_user_model()
+
+# Fields loaded from the token; everything else is deferred and fetched
+# from the database only if a view touches it
+USER_CLAIMS = {
+    "username": "username",
+    "email": "email",
+    "mobile": "mobile_number",
+}
+
+
+def stateless_auth_enabled():
+    return getattr(settings, "JWT_STATELESS_AUTH", False)
+
+
+def get_company_claims(user_id):
+    return [
+        list(row)
+        for row in CompanyMembership.objects.filter(
+            user_id=user_id, status="ACTIVE"
+        )
+        .order_by("pk")
+        .values_list("company_id", "company__slug", "company__name", "role")
+    ]
+
+
+def issue_access_token(refresh, user=None):
+    """
+    Access token for ``refresh``, with identity and role claims when
+    stateless auth is enabled. Raises ``User.DoesNotExist`` if the user
+    is gone or inactive.
+    """
+    access = refresh.access_token
+    if not stateless_auth_enabled():
+        return access
+
+    if user is None:
+        user = User.objects.get(
+            pk=refresh[api_settings.USER_ID_CLAIM], is_active=True
+        )
+
+    for claim, field in USER_CLAIMS.items():
+        access[claim] = getattr(user, field)
+    access["companies"] = get_company_claims(user.pk)
+    access["cv"] = get_user_version(user.pk)
+    return access
+
+
+def user_from_token(token):
+    """
+    A ``User`` instance built from the token's claims, or None if the
+    token has no claims or they are stale and the user must be loaded
+    from the database.
+    """
+    if "cv" not in token or not stateless_auth_enabled():
+        return None
+
+    user_id = token[api_settings.USER_ID_CLAIM]
+    if token["cv"] != get_user_version(user_id):
+        return None
+
+    loaded = {"id": user_id, "is_active": True}
+    for claim, field in USER_CLAIMS.items():
+        loaded[field] = token.get(claim)
+
+    # from_db() takes values in concrete field order
+    fields = [
+        field.attname
+        for field in User._meta.concrete_fields
+        if field.attname in loaded
+    ]
+    user = User.from_db("default", fields, [loaded[name] for name in fields])
+
+    # Read by company.permissions, so role checks don't query either
+    user._company_roles = {
+        company_id: role for company_id, _, _, role in token["companies"]
+    }
+    user._company_claims = token["companies"]
+    return user
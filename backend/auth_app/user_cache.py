@@ -0,0 +1,80 @@
+# auth_app/user_cache.py
+"""
+Cached user resolution for token authentication.
+
+Each user has a version in the cache, bumped whenever the user row (or
+one of their memberships, see ``auth_app.tokens``) changes. User rows
+are cached under ``(user_id, version)`` in Redis and in a per-process
+LRU, so resolving the user of a token costs one cache read for the
+version and no database query; a bump makes every cached copy
+unreachable at once.
+"""
+
+from functools import lru_cache
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
+
+from CoreApi.versioning import bump_versions, get_version
+
+User = get_user_model()
+
+USER_CACHE_SECONDS = 60 * 60
+
+LOCAL_CACHE_SIZE = 1024
+
+# The password hash is never cached; it stays deferred and is loaded on
+# the rare request that needs it
+CACHED_FIELDS = [
+    field.attname
+    for field in User._meta.concrete_fields
+    if field.attname != "password"
+]
+
+
+def _version_key(user_id):
+    return f"auth:user-version:{user_id}"
+
+
+def get_user_version(user_id):
+    return get_version(_version_key(user_id))
+
+
+def bump_user_versions(user_ids):
+    user_ids = {user_id for user_id in user_ids if user_id}
+
+    if user_ids:
+        transaction.on_commit(
+            lambda: bump_versions(_version_key(user_id) for user_id in user_ids)
+        )
+
+
+@lru_cache(maxsize=LOCAL_CACHE_SIZE)
+def _get_user_row(user_id, version):
+    # Stale versions are never asked for again and age out of the LRU
+    key = f"auth:user:{user_id}:{version}"
+
+    row = cache.get(key)
+    if row is None:
+        row = (
+            User.objects.filter(pk=user_id)
+            .values_list(*CACHED_FIELDS)
+            .first()
+        )
+        if row is None:
+            return None
+        cache.set(key, row, USER_CACHE_SECONDS)
+    return row
+
+
+def get_cached_user(user_id):
+    """
+    A fresh ``User`` instance for ``user_id``, or None if there is no
+    such user.
+    """
+    row = _get_user_row(user_id, get_user_version(user_id))
+    if row is None:
+        return None
+    # A new instance per call, so requests never share mutable state
+    return User.from_db("default", CACHED_FIELDS, row)
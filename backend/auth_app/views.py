@@ -17,9 +17,11 @@ from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.csrf import ensure_csrf_cookie
-from company.models import CompanyMembership
+
+from CoreApi.throttling import RateLimitThrottle
 
 from .authentication import JWTAuthenticationFromCookie
+from .tokens import get_company_claims, issue_access_token
 from .serializers import (
     RegisterSerializer,
     ProfileSerializer,
@@ -45,6 +47,9 @@ class ProtectedView(APIView):
 
 
 class RegisterView(APIView):
+    throttle_classes = [RateLimitThrottle]
+    throttle_scope = "register"
+
     def post(self, request):
         serializer = RegisterSerializer(data=request.data)
 
@@ -59,6 +64,8 @@ class RegisterView(APIView):
 
 
 class LoginView(APIView):
+    throttle_classes = [RateLimitThrottle]
+    throttle_scope = "login"
 
     def post(self, request):
         user = authenticate(
@@ -83,7 +90,9 @@ class LoginView(APIView):
             "path": "/",
         }
 
-        res.set_cookie("access", str(refresh.access_token), **cookie_kwargs)
+        res.set_cookie(
+            "access", str(issue_access_token(refresh, user)), **cookie_kwargs
+        )
         res.set_cookie("refresh", str(refresh), **cookie_kwargs)
 
         return res
@@ -99,13 +108,15 @@ class RefreshView(APIView):
 
         try:
             token = RefreshToken(refresh)
+            # Re-reads role claims, so membership changes show up here
+            access = issue_access_token(token)
         except Exception:
             return Response(status=status.HTTP_401_UNAUTHORIZED)
 
         res = Response(status=status.HTTP_200_OK)
         res.set_cookie(
             "access",
-            str(token.access_token),
+            str(access),
             httponly=True,
             secure=True,
             samesite="None",
@@ -150,26 +161,25 @@ class MeView(APIView):
     def get(self, request):
         user = request.user
 
-        memberships = (
-            CompanyMembership.objects
-            .filter(user=user, status="ACTIVE")
-            .select_related("company")
-        )
+        # Taken from the access token in stateless mode
+        memberships = getattr(user, "_company_claims", None)
+        if memberships is None:
+            memberships = get_company_claims(user.pk)
 
         return Response({
             "id": user.id,
             "email": user.email,
             "username": user.username,
-            "is_business": memberships.exists(),
+            "is_business": bool(memberships),
             "mobile_number": user.mobile_number,
             "companies": [
                 {
-                    "company_id": m.company.id,
-                    "company_slug": m.company.slug,
-                    "company_name": m.company.name,
-                    "role": m.role,
+                    "company_id": company_id,
+                    "company_slug": slug,
+                    "company_name": name,
+                    "role": role,
                 }
-                for m in memberships
+                for company_id, slug, name, role in memberships
             ],
         })
 
@@ -209,6 +219,9 @@ class ProfileView(APIView):
 # ==========================
 
 class ForgotPasswordView(APIView):
+    throttle_classes = [RateLimitThrottle]
+    throttle_scope = "forgot-password"
+
     def post(self, request):
         serializer = ForgotPasswordSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
@@ -0,0 +1,68 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:36
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_rating_aggregates(apps, schema_editor):
+    BlogPost = apps.get_model("blog", "BlogPost")
+    Review = apps.get_model("review", "Review")
+    ContentType = apps.get_model("contenttypes", "ContentType")
+
+    blog_ct = ContentType.objects.filter(app_label="blog", model="blogpost").first()
+    if blog_ct is None:
+        return
+
+    totals = {
+        row["object_id"]: row
+        for row in Review.objects.filter(
+            content_type=blog_ct,
+            moderation_status="approved",
+            rating__gte=1,
+            rating__lte=5,
+        )
+        .values("object_id")
+        .annotate(n=Count("id"), total=Sum("rating"))
+        .order_by()
+    }
+
+    posts = list(BlogPost.objects.filter(pk__in=totals))
+    for post in posts:
+        row = totals[post.pk]
+        post.rating_count = row["n"]
+        post.rating_sum = row["total"]
+        post.rating_average = round(Decimal(row["total"]) / row["n"], 2)
+
+    BlogPost.objects.bulk_update(
+        posts, ["rating_average", "rating_count", "rating_sum"], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_alter_blogcategory_options_alter_blogpost_options_and_more'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('review', '0012_review_public_feed_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='rating_average',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=3),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='rating_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='rating_sum',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_rating_aggregates, migrations.RunPython.noop),
+    ]
@@ -4,7 +4,7 @@ from django.utils import timezone
 from django.contrib.contenttypes.fields import GenericRelation
 from review.models import Review
 from django.contrib.postgres.indexes import GinIndex
-from django.contrib.postgres.search import SearchVectorField
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from tinymce.models import HTMLField  # ✅ Import TinyMCE HTMLField
 
 class BlogCategory(models.Model):
@@ -86,12 +86,24 @@ class BlogPost(models.Model):
     seo_title = models.CharField(max_length=255, blank=True)
     seo_description = models.TextField(blank=True)
 
+    # Review aggregates, maintained incrementally by review.aggregates
+    rating_average = models.DecimalField(max_digits=3, decimal_places=2, default=0)
+    rating_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveBigIntegerField(default=0)
+
     # System
     view_count = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(default=timezone.now)
     
     search_vector = SearchVectorField(null=True)  # <-- Postgres full-text
+
+    # Unstemmed title tokens for word-prefix matching (see content.matching)
+    title_tokens = models.GeneratedField(
+        expression=SearchVector("title", config="simple"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
     
     class Meta:
         ordering = ['-published_at', '-created_at']
@@ -112,6 +124,9 @@ class BlogPost(models.Model):
                 name="blog_title_trgm",
                 opclasses=["gin_trgm_ops"],
             ),
+
+            # 🔥 Word-prefix matching
+            GinIndex(fields=["title_tokens"], name="blog_title_tokens"),
         ]
 
 
@@ -122,6 +137,7 @@ class BlogPost(models.Model):
         ):
             self.published_at = timezone.now()
 
+        self.updated_at = timezone.now()
         super().save(*args, **kwargs)
 
     def __str__(self):
@@ -1,47 +1,30 @@
 # signals.py
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
-from django.contrib.postgres.search import SearchVector
 from blog.models import BlogPost
 from company.models import Company
 from review.models import Review
+from content.autocomplete import schedule_reindex
+from content.search_index import get_indexed_fields, mark_dirty
+from CoreApi.tracking import on_fields_changed
 
-@receiver(post_save, sender=BlogPost)
-def update_blog_search_vector(sender, instance, **kwargs):
-    BlogPost.objects.filter(pk=instance.pk).update(
-        search_vector=(
-            SearchVector("title", weight="A") +
-            SearchVector("excerpt", weight="B") +
-            SearchVector("content", weight="C")
-        )
-    )
+# Search vectors are recomputed in batches by content.tasks; a save only
+# marks the row dirty, and only when an indexed field changed
+def update_search_vector(instance, **kwargs):
+    mark_dirty(instance._meta.label_lower, instance.pk)
 
-@receiver(post_save, sender=Company)
-def update_company_search_vector(sender, instance, **kwargs):
-    Company.objects.filter(pk=instance.pk).update(
-        search_vector=(
-            # Core identity
-            SearchVector("name", weight="A") +
-            SearchVector("tagline", weight="A") +
-            SearchVector("description", weight="B") +
 
-            # Address / Contact
-            SearchVector("address_line_1", weight="C") +
-            SearchVector("address_line_2", weight="C") +
-            SearchVector("city", weight="B") +
-            SearchVector("state", weight="C") +
-            SearchVector("postal_code", weight="D") +
-            SearchVector("country", weight="B")
-        )
+for model in (BlogPost, Company, Review):
+    on_fields_changed(model, get_indexed_fields(model._meta.label_lower))(
+        update_search_vector
     )
 
 
-@receiver(post_save, sender=Review)
-def update_review_search_vector(sender, instance, **kwargs):
-    Review.objects.filter(pk=instance.pk).update(
-        search_vector=(
-            SearchVector("title", weight="A") +
-            SearchVector("body", weight="B") +
-            SearchVector("author_name", weight="C")
-        )
-    )
\ No newline at end of file
+@receiver([post_save, post_delete], sender=BlogPost)
+def update_blog_autocomplete(sender, instance, **kwargs):
+    schedule_reindex("blog", instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Company)
+def update_company_autocomplete(sender, instance, **kwargs):
+    schedule_reindex("company", instance.pk)
@@ -2,9 +2,8 @@
 
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
-from django.db.models import Avg, Count, Q, F
+from django.db.models import Avg, Count, Max, Q
 from django.contrib.contenttypes.models import ContentType
-from django.core.cache import cache
 from django.db.utils import IntegrityError
 from rest_framework.views import APIView
 from rest_framework.generics import ListAPIView, RetrieveAPIView
@@ -20,9 +19,11 @@ from .serializers import (
 )
 from .pagination import BlogPostPagination
 
-from review.serializers import ReviewSerializer, ReviewCreateSerializer
-from review.services import get_reviews_for_object
+from review.serializers import ReviewCreateSerializer
+from review.services import get_public_reviews_payload
 from review.models import Review
+from analytics.mixins import RecordViewMixin
+from CoreApi.conditional import ConditionalGetMixin
 
 
 # ------------------------------------
@@ -61,7 +62,7 @@ class BlogPostListView(ListAPIView):
                 ),
             )
             .filter(
-                status="PUBLISHED",
+                status=BlogPost.Status.PUBLISHED,
                 published_at__lte=timezone.now(),
             )
             .order_by("-published_at")
@@ -71,7 +72,7 @@ class BlogPostListView(ListAPIView):
 # ------------------------------------
 # Blog Detail
 # ------------------------------------
-class BlogPostDetailView(RetrieveAPIView):
+class BlogPostDetailView(RecordViewMixin, ConditionalGetMixin, RetrieveAPIView):
     """
     GET /api/blog/<slug>/
     """
@@ -79,6 +80,43 @@ class BlogPostDetailView(RetrieveAPIView):
     permission_classes = [AllowAny]
     serializer_class = BlogPostDetailSerializer
     lookup_field = "slug"
+    viewed_model = BlogPost
+
+    def get_validator_row(self, slug):
+        # Shared by the validators and the view counter
+        if not hasattr(self, "_validator_row"):
+            self._validator_row = (
+                BlogPost.objects.filter(
+                    slug=slug,
+                    status=BlogPost.Status.PUBLISHED,
+                    published_at__lte=timezone.now(),
+                )
+                .values_list(
+                    "pk",
+                    "updated_at",
+                    "rating_count",
+                    "rating_sum",
+                    "view_count",
+                    "category__name",
+                    "author__username",
+                )
+                .first()
+            )
+        return self._validator_row
+
+    def get_validators(self, request, *args, **kwargs):
+        # Everything the payload renders: rating/reviewCount follow
+        # rating_count/rating_sum (kept in step by review.aggregates),
+        # views is view_count, which changes at most once per counter
+        # flush, and category and author names live on other rows
+        row = self.get_validator_row(kwargs["slug"])
+        if row is None:
+            return None, None
+        return row, row[1]
+
+    def get_viewed_pk(self, request, *args, **kwargs):
+        row = self.get_validator_row(kwargs["slug"])
+        return row[0] if row else None
 
     def get_queryset(self):
         ct = ContentType.objects.get_for_model(BlogPost)
@@ -103,32 +141,11 @@ class BlogPostDetailView(RetrieveAPIView):
                 ),
             )
             .filter(
-                status="PUBLISHED",
+                status=BlogPost.Status.PUBLISHED,
                 published_at__lte=timezone.now(),
             )
         )
 
-    def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-
-        # Identify viewer (user-id preferred, fallback to IP)
-        if request.user.is_authenticated:
-            viewer_id = f"user:{request.user.id}"
-        else:
-            ip = request.META.get("REMOTE_ADDR", "unknown")
-            viewer_id = f"ip:{ip}"
-
-        cache_key = f"blog:view:{instance.pk}:{viewer_id}"
-
-        # Count view only once per viewer per 24h
-        if not cache.get(cache_key):
-            BlogPost.objects.filter(pk=instance.pk).update(
-                view_count=F("view_count") + 1
-            )
-            cache.set(cache_key, True, timeout=60 * 60 * 24)
-
-        return super().retrieve(request, *args, **kwargs)
-
 
 # ------------------------------------
 # Blog Reviews (GET + POST)
@@ -145,28 +162,23 @@ class BlogPostReviewAPIView(APIView):
         blog = get_object_or_404(
             BlogPost,
             slug=slug,
-            status="PUBLISHED",
+            status=BlogPost.Status.PUBLISHED,
             published_at__lte=timezone.now(),
         )
 
-        page = int(request.query_params.get("page", 1))
-        page_size = int(request.query_params.get("page_size", 10))
-
-        data = get_reviews_for_object(
-            obj=blog,
-            page=page,
-            page_size=page_size,
-        )
-
-        serializer = ReviewSerializer(data["results"], many=True)
+        try:
+            payload = get_public_reviews_payload(
+                blog,
+                request.query_params,
+                default_page_size=10,
+            )
+        except ValueError as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        return Response(
-            {
-                "count": data["count"],
-                "results": serializer.data,
-            },
-            status=status.HTTP_200_OK,
-        )
+        return Response(payload, status=status.HTTP_200_OK)
     
     # BlogPostReviewAPIView post method
     def post(self, request, slug):
@@ -179,7 +191,7 @@ class BlogPostReviewAPIView(APIView):
         blog = get_object_or_404(
             BlogPost,
             slug=slug,
-            status="PUBLISHED",
+            status=BlogPost.Status.PUBLISHED,
             published_at__lte=timezone.now(),
         )
 
@@ -250,7 +262,7 @@ class BlogCategoryListView(ListAPIView):
                 post_count=Count(
                     "posts",
                     filter=Q(
-                        posts__status="PUBLISHED",
+                        posts__status=BlogPost.Status.PUBLISHED,
                         posts__published_at__lte=timezone.now(),
                     ),
                 )
@@ -260,7 +272,7 @@ class BlogCategoryListView(ListAPIView):
         )
 
 
-class BlogSitemapAPIView(APIView):
+class BlogSitemapAPIView(ConditionalGetMixin, APIView):
     """
     GET /api/sitemap/blog/
     Returns minimal data required for sitemap generation.
@@ -268,14 +280,24 @@ class BlogSitemapAPIView(APIView):
 
     permission_classes = [AllowAny]
 
-    def get(self, request):
-        posts = (
-            BlogPost.objects
-            .filter(
-                status=BlogPost.Status.PUBLISHED,
-                published_at__lte=timezone.now(),
-            )
-            .values("slug", "updated_at")
+    def get_queryset(self):
+        return BlogPost.objects.filter(
+            status=BlogPost.Status.PUBLISHED,
+            published_at__lte=timezone.now(),
         )
 
+    def get_validators(self, request, *args, **kwargs):
+        # Scheduled posts appear when published_at passes, without a save
+        stats = self.get_queryset().aggregate(
+            n=Count("pk"),
+            updated=Max("updated_at"),
+            published=Max("published_at"),
+        )
+        changed = [d for d in (stats["updated"], stats["published"]) if d]
+        last_modified = max(changed) if changed else None
+        return (stats["n"], last_modified), last_modified
+
+    def get(self, request):
+        posts = self.get_queryset().values("slug", "updated_at")
+
         return Response(posts)
\ No newline at end of file
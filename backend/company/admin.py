@@ -4,6 +4,7 @@ from django.db import transaction
 from django.utils import timezone
 from django.utils.html import format_html
 from company.models import CompanySuggestion
+from company.permissions import invalidate_company_roles
 
 from company.models import (
     Company,
@@ -288,6 +289,9 @@ def approve_onboarding_request(request_obj, admin_user):
         company=company,
         defaults={"role": "OWNER", "status": "ACTIVE"},
     )
+    # The membership signal does this too; a stale entry would lock the
+    # new owner out of their dashboard, so don't rely on it alone
+    invalidate_company_roles([data["user_id"]])
 
     CompanyOnboardingRequest.objects.filter(pk=request_obj.pk).update(
         status="APPROVED",
@@ -0,0 +1,96 @@
+# company/listing.py
+"""
+Response cache for the public company listing.
+
+Cached pages are grouped under tags: "all" for the unfiltered listing and
+"cat:<slug>" per category. Each tag has a version stored in the cache
+and every page key embeds the version of its tag, so bumping a tag
+orphans all pages built under it without scanning or deleting keys.
+Entries still carry a long TTL so orphans eventually expire.
+"""
+
+from django.db import transaction
+
+from company.models import Company, CompanyCategory
+from company.ranking import sync_company_ranks
+from CoreApi.versioning import bump_versions, get_version
+
+LISTING_CACHE_SECONDS = 60 * 60 * 24
+
+# Fields that change what CompanyListAPIView returns or how it is ordered
+LISTING_FIELDS = (
+    "name",
+    "slug",
+    "city",
+    "country",
+    "tagline",
+    "logo",
+    "rating_average",
+    "rating_count",
+    "is_verified",
+    "is_active",
+    "display_order",
+    "category_id",
+)
+
+
+def _tag_key(tag):
+    return f"company-list:tag:{tag}"
+
+
+def get_tag_version(tag):
+    return get_version(_tag_key(tag))
+
+
+def bump_tags(tags):
+    bump_versions(_tag_key(tag) for tag in tags)
+
+
+def get_listing_cache_key(request):
+    category = request.query_params.get("category") or ""
+    tag = f"cat:{category}" if category else "all"
+
+    return ":".join(
+        [
+            "company-list",
+            str(get_tag_version(tag)),
+            request.get_host(),
+            category,
+            request.query_params.get("page", "1"),
+            request.query_params.get("page_size", ""),
+        ]
+    )
+
+
+def invalidate_company_listing(category_ids=()):
+    """
+    Drop cached listing pages for the unfiltered listing and the given
+    categories once the current transaction commits.
+    """
+    category_ids = {pk for pk in category_ids if pk}
+
+    def bump():
+        tags = ["all"]
+        if category_ids:
+            slugs = CompanyCategory.objects.filter(pk__in=category_ids).values_list(
+                "slug", flat=True
+            )
+            tags += [f"cat:{slug}" for slug in slugs]
+        bump_tags(tags)
+
+    transaction.on_commit(bump)
+
+
+def companies_listing_changed(company_ids):
+    """
+    Hook for writes that bypass Company.save() (queryset.update,
+    bulk_update), e.g. rating aggregate updates.
+    """
+    category_ids = Company.objects.filter(pk__in=company_ids).values_list(
+        "category_id", flat=True
+    )
+    # on_commit callbacks run in registration order: the ranks must be
+    # written before the tag bump, or a request in between would cache
+    # the old order under the new version
+    sync_company_ranks(company_ids)
+    invalidate_company_listing(set(category_ids))
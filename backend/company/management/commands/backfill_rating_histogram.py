@@ -0,0 +1,74 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from company.models import Company
+from review.aggregates import (
+    STAR_FIELDS,
+    find_drifted_ratings,
+    rebuild_company_ratings,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Backfill the per-star rating histogram on Company from approved "
+        "reviews, in primary-key batches. The other rating aggregates are "
+        "rebuilt along with it. Use --verify to only report mismatches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Report mismatching companies without writing",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        verify = options["verify"]
+        fields = list(STAR_FIELDS.values())
+
+        checked = 0
+        mismatched = 0
+        last_pk = 0
+
+        while True:
+            ids = list(
+                Company.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+
+            if verify:
+                drifted = find_drifted_ratings(Company, ids)
+                for company, expected in drifted:
+                    self.stdout.write(
+                        f"Company #{company.pk}: "
+                        f"{[getattr(company, f) for f in fields]} "
+                        f"-> {[expected[f] for f in fields]}"
+                    )
+                mismatched += len(drifted)
+            else:
+                # Same path as reconcile_rating_aggregates: all aggregate
+                # columns, updated_at and the listing caches
+                repaired = rebuild_company_ratings(ids)
+                for pk in repaired:
+                    self.stdout.write(f"Repaired Company #{pk}")
+                mismatched += len(repaired)
+
+            checked += len(ids)
+            last_pk = ids[-1]
+
+        if verify and mismatched:
+            raise CommandError(
+                f"{mismatched} of {checked} companies have stale rating aggregates"
+            )
+
+        action = "Found" if verify else "Backfilled"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Checked {checked} companies. {action} {mismatched} mismatches."
+            )
+        )
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from company.tasks import rebuild_company_ranking
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the Redis ranking sets that back the public company "
+        "listing from Postgres."
+    )
+
+    def handle(self, *args, **options):
+        ranked = rebuild_company_ranking()
+
+        if ranked is None:
+            self.stdout.write(self.style.WARNING("A rebuild is already running."))
+            return
+
+        self.stdout.write(self.style.SUCCESS(f"Ranked {ranked} companies."))
@@ -0,0 +1,81 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:28
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_rating_totals(apps, schema_editor):
+    Company = apps.get_model("company", "Company")
+    Review = apps.get_model("review", "Review")
+    ContentType = apps.get_model("contenttypes", "ContentType")
+
+    company_ct = ContentType.objects.filter(app_label="company", model="company").first()
+    if company_ct is None:
+        return
+
+    totals = {}
+    rows = (
+        Review.objects.filter(content_type=company_ct, moderation_status="approved")
+        .values("object_id", "rating")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+    for row in rows:
+        if 1 <= row["rating"] <= 5:
+            totals.setdefault(row["object_id"], {})[row["rating"]] = row["n"]
+
+    companies = list(Company.objects.filter(pk__in=totals))
+    for company in companies:
+        stars = totals[company.pk]
+        for star in range(1, 6):
+            setattr(company, f"rating_{star}_count", stars.get(star, 0))
+        company.rating_sum = sum(star * n for star, n in stars.items())
+
+    Company.objects.bulk_update(
+        companies,
+        ["rating_sum"] + [f"rating_{star}_count" for star in range(1, 6)],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company', '0005_alter_companysuggestion_options'),
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('review', '0011_alter_review_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='rating_1_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='rating_2_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='rating_3_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='rating_4_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='rating_5_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='rating_sum',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_rating_totals, migrations.RunPython.noop),
+    ]
@@ -7,7 +7,7 @@ from django.contrib.contenttypes.fields import GenericRelation
 from django.core.exceptions import ValidationError
 from auth_app.models import User
 from django.contrib.postgres.indexes import GinIndex
-from django.contrib.postgres.search import SearchVectorField
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 
 
 class CompanyCategory(models.Model):
@@ -90,6 +90,14 @@ class Company(models.Model):
     )
     rating_count = models.PositiveIntegerField(default=0)
 
+    # Running totals maintained incrementally by review.aggregates
+    rating_sum = models.PositiveBigIntegerField(default=0)
+    rating_1_count = models.PositiveIntegerField(default=0)
+    rating_2_count = models.PositiveIntegerField(default=0)
+    rating_3_count = models.PositiveIntegerField(default=0)
+    rating_4_count = models.PositiveIntegerField(default=0)
+    rating_5_count = models.PositiveIntegerField(default=0)
+
     reviews = GenericRelation("review.Review", related_query_name="company")
 
     # --------------------
@@ -111,6 +119,13 @@ class Company(models.Model):
     updated_at = models.DateTimeField(default=timezone.now)
     search_vector = SearchVectorField(null=True)  # <-- Postgres full-text
 
+    # Unstemmed name tokens for word-prefix matching (see content.matching)
+    name_tokens = models.GeneratedField(
+        expression=SearchVector("name", config="simple"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     class Meta:
         ordering = ["display_order","-rating_average", "-rating_count"]
         indexes = [
@@ -135,6 +150,7 @@ class Company(models.Model):
                 opclasses=["text_pattern_ops"],
             ),
             models.Index(fields=["display_order"]),
+            GinIndex(fields=["name_tokens"], name="company_name_tokens"),
         ]
 
     def save(self, *args, **kwargs):
@@ -1,13 +1,57 @@
+# company/permissions.py
+"""
+Company membership checks.
+
+A user's active memberships are loaded as one ``{company_id: role}``
+dict, cached per user for ``MEMBERSHIP_CACHE_SECONDS`` and memoized on
+the user object for the rest of the request. Saving or deleting a
+CompanyMembership drops the cached entry of its user.
+"""
+
+from django.core.cache import cache
+from django.db import transaction
+
 from company.models import CompanyMembership
 
+MEMBERSHIP_CACHE_SECONDS = 60 * 5
 
-def user_can_manage_company(user, company):
+MANAGE_ROLES = frozenset({"OWNER", "MANAGER"})
+
+
+def _membership_key(user_id):
+    return f"company-membership:{user_id}"
+
+
+def get_company_roles(user):
+    """
+    ``{company_id: role}`` for the active memberships of ``user``.
+    """
     if not user or not user.is_authenticated:
-        return False
-
-    return CompanyMembership.objects.filter(
-        user=user,
-        company=company,
-        status="ACTIVE",
-        role__in=["OWNER", "MANAGER"],
-    ).exists()
+        return {}
+
+    roles = getattr(user, "_company_roles", None)
+    if roles is not None:
+        return roles
+
+    key = _membership_key(user.pk)
+    roles = cache.get(key)
+    if roles is None:
+        roles = dict(
+            CompanyMembership.objects.filter(
+                user_id=user.pk, status="ACTIVE"
+            ).values_list("company_id", "role")
+        )
+        cache.set(key, roles, MEMBERSHIP_CACHE_SECONDS)
+
+    user._company_roles = roles
+    return roles
+
+
+def invalidate_company_roles(user_ids):
+    keys = [_membership_key(user_id) for user_id in set(user_ids) if user_id]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def user_can_manage_company(user, company):
+    return get_company_roles(user).get(company.pk) in MANAGE_ROLES
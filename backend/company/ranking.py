@@ -0,0 +1,262 @@
+# company/ranking.py
+"""
+Precomputed ranking for the public company listing.
+
+Active companies are kept in Redis sorted sets, one for the whole listing
+and one per category. Every member has score 0 and encodes the listing
+order as a fixed-width string:
+
+    <display_order, NULLs last>:<inverted rating_average>:
+    <inverted rating_count>:<pk>
+
+With equal scores Redis orders members lexicographically, so ZRANGE by
+index returns a page in listing order in O(log N + page size) without
+a sort or a join on category in Postgres. A hash maps each company to
+its current member so an update can ZREM the old entry before adding
+the new one.
+"""
+
+from django.db import transaction
+from django_redis import get_redis_connection
+
+from company.models import Company
+from CoreApi.locks import redis_lock
+
+RANK_PREFIX = "company-rank"
+
+MEMBERS_KEY = f"{RANK_PREFIX}:members"
+READY_KEY = f"{RANK_PREFIX}:ready"
+LOCK_KEY = f"{RANK_PREFIX}:lock"
+
+RANK_FIELDS = ("pk", "category_id", "display_order", "rating_average", "rating_count")
+
+REBUILD_BATCH_SIZE = 1000
+
+# Largest 10-digit value: members pad counters to 10 digits, and this
+# sorts after any PositiveIntegerField value (at most 2147483647)
+_MAX_INT = 9_999_999_999
+
+# Swap the old member for the new one in both the global and the category
+# set atomically. An empty new member removes the company.
+_SYNC_SCRIPT = """
+local old = redis.call('HGET', KEYS[1], ARGV[1])
+if old then
+    local sep = string.find(old, '|', 1, true)
+    local old_category = string.sub(old, 1, sep - 1)
+    local old_member = string.sub(old, sep + 1)
+    redis.call('ZREM', KEYS[2], old_member)
+    if old_category ~= '' then
+        redis.call('ZREM', ARGV[2] .. old_category, old_member)
+    end
+end
+if ARGV[4] == '' then
+    redis.call('HDEL', KEYS[1], ARGV[1])
+    return 0
+end
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[3] .. '|' .. ARGV[4])
+redis.call('ZADD', KEYS[2], 0, ARGV[4])
+if ARGV[3] ~= '' then
+    redis.call('ZADD', ARGV[2] .. ARGV[3], 0, ARGV[4])
+end
+return 1
+"""
+
+
+def get_redis():
+    return get_redis_connection("default")
+
+
+def _index_key(category_id=None, prefix=RANK_PREFIX):
+    if category_id is None:
+        return f"{prefix}:all"
+    return f"{prefix}:cat:{category_id}"
+
+
+def get_rank_member(values):
+    """
+    Sortable member for a company, from a dict of ``RANK_FIELDS``.
+    """
+    display_order = values["display_order"]
+    if display_order is None:
+        display_order = _MAX_INT
+
+    average = int(round((values["rating_average"] or 0) * 100))
+    count = values["rating_count"] or 0
+
+    return (
+        f"{display_order:010d}:{500 - average:03d}:"
+        f"{_MAX_INT - count:010d}:{values['pk']:020d}"
+    )
+
+
+def get_member_pk(member):
+    return int(member.rsplit(":", 1)[1])
+
+
+def _sync(conn, pk, category_id, member):
+    conn.eval(
+        _SYNC_SCRIPT,
+        2,
+        MEMBERS_KEY,
+        _index_key(),
+        pk,
+        f"{RANK_PREFIX}:cat:",
+        "" if category_id is None else category_id,
+        member or "",
+    )
+
+
+def sync_company_ranks(company_ids):
+    """
+    Re-rank the given companies from their current rows once the
+    transaction commits. Inactive or deleted companies are dropped.
+    """
+    company_ids = set(company_ids)
+
+    def sync():
+        conn = get_redis()
+        if not conn.exists(READY_KEY):
+            # The next listing request builds the whole index
+            return
+
+        rows = {
+            row["pk"]: row
+            for row in Company.objects.filter(
+                pk__in=company_ids, is_active=True
+            ).values(*RANK_FIELDS)
+        }
+
+        for pk in sorted(company_ids):
+            row = rows.get(pk)
+            if row is None:
+                _sync(conn, pk, None, None)
+            else:
+                _sync(conn, pk, row["category_id"], get_rank_member(row))
+
+    transaction.on_commit(sync)
+
+
+def rebuild_listing_index():
+    """
+    Rebuild every ranking set from Postgres into temporary keys and swap
+    them in at once. Returns the number of ranked companies.
+    """
+    conn = get_redis()
+    build_prefix = f"{RANK_PREFIX}:build"
+
+    for key in conn.scan_iter(f"{build_prefix}:*"):
+        conn.delete(key)
+
+    build_members = f"{build_prefix}:members"
+    category_ids = set()
+    ranked = 0
+    last_pk = 0
+
+    qs = Company.objects.filter(is_active=True).order_by("pk").values(*RANK_FIELDS)
+
+    while True:
+        rows = list(qs.filter(pk__gt=last_pk)[:REBUILD_BATCH_SIZE])
+        if not rows:
+            break
+
+        pipe = conn.pipeline(transaction=False)
+        for row in rows:
+            member = get_rank_member(row)
+            category_id = row["category_id"]
+
+            pipe.zadd(_index_key(prefix=build_prefix), {member: 0})
+            if category_id is not None:
+                category_ids.add(category_id)
+                pipe.zadd(_index_key(category_id, prefix=build_prefix), {member: 0})
+            pipe.hset(
+                build_members,
+                row["pk"],
+                f"{'' if category_id is None else category_id}|{member}",
+            )
+        pipe.execute()
+
+        ranked += len(rows)
+        last_pk = rows[-1]["pk"]
+
+    stale = [
+        key
+        for key in conn.scan_iter(f"{RANK_PREFIX}:cat:*")
+        if int(key.rsplit(b":", 1)[1]) not in category_ids
+    ]
+
+    pipe = conn.pipeline(transaction=True)
+    if stale:
+        pipe.delete(*stale)
+    for key, build_key in (
+        (MEMBERS_KEY, build_members),
+        (_index_key(), _index_key(prefix=build_prefix)),
+        *(
+            (_index_key(pk), _index_key(pk, prefix=build_prefix))
+            for pk in category_ids
+        ),
+    ):
+        if ranked:
+            pipe.rename(build_key, key)
+        else:
+            pipe.delete(key)
+    pipe.set(READY_KEY, 1)
+    pipe.execute()
+
+    return ranked
+
+
+def ensure_listing_index():
+    """
+    True when the ranking sets can be read. Builds them on first use; if
+    another process holds the build lock, returns False so the caller
+    can fall back to Postgres.
+    """
+    conn = get_redis()
+    if conn.exists(READY_KEY):
+        return True
+
+    with redis_lock(LOCK_KEY, timeout=300) as acquired:
+        if acquired and not conn.exists(READY_KEY):
+            rebuild_listing_index()
+    return acquired
+
+
+def drop_category_index(category_id):
+    get_redis().delete(_index_key(category_id))
+
+
+class RankedCompanyList:
+    """
+    Sequence over one ranking set, sliced by ``Paginator``: ``count()``
+    is a ZCARD and every slice one ZRANGE plus one primary-key query.
+    """
+
+    def __init__(self, category_id=None):
+        self.key = _index_key(category_id)
+
+    def count(self):
+        return get_redis().zcard(self.key)
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self[index : index + 1][0]
+
+        start = index.start or 0
+        stop = self.count() if index.stop is None else index.stop
+        if stop <= start:
+            return []
+
+        ids = [
+            get_member_pk(member.decode())
+            for member in get_redis().zrange(self.key, start, stop - 1)
+        ]
+
+        companies = (
+            Company.objects.filter(pk__in=ids, is_active=True)
+            .select_related("category")
+            .in_bulk()
+        )
+        return [companies[pk] for pk in ids if pk in companies]
@@ -1,9 +1,7 @@
 # companies/serializers.py
 from rest_framework import serializers
 from .models import Company, CompanyOnboardingRequest
-from django.db.models import Count
-from review.models import Review
-from django.contrib.contenttypes.models import ContentType
+from review.aggregates import STAR_FIELDS
 from company.models import CompanySuggestion
 
 
@@ -86,25 +84,9 @@ class CompanyDetailSerializer(serializers.ModelSerializer):
             "rating_breakdown",
         ]
     def get_rating_breakdown(self, company):
-
-        company_ct = ContentType.objects.get_for_model(company)
-
-        qs = (
-            Review.objects
-            .filter(
-                content_type=company_ct,
-                object_id=company.id,
-                moderation_status=Review.ModerationStatus.APPROVED,
-            )
-            .values("rating")
-            .annotate(count=Count("id"))
-        )
-
-        # Normalize to always return 1–5
-        rating_map = {row["rating"]: row["count"] for row in qs}
-
+        # Denormalized per-star counts, kept current by review.aggregates
         return [
-            {"rating": rating, "count": rating_map.get(rating, 0)}
+            {"rating": rating, "count": getattr(company, STAR_FIELDS[rating])}
             for rating in range(5, 0, -1)
         ]
 
@@ -0,0 +1,62 @@
+# company/signals.py
+from django.db.models.signals import post_init, post_save, post_delete
+from django.db import transaction
+from django.dispatch import receiver
+
+from CoreApi.tracking import on_fields_changed
+
+from .models import Company, CompanyCategory, CompanyMembership
+from .listing import (
+    LISTING_FIELDS,
+    bump_tags,
+    invalidate_company_listing,
+)
+from .permissions import invalidate_company_roles
+from .ranking import drop_category_index, sync_company_ranks
+
+
+# ------------------------------------
+# Company listing cache invalidation
+# ------------------------------------
+@on_fields_changed(Company, LISTING_FIELDS)
+def on_company_listing_change(instance, old, created):
+    # Ranks first; see companies_listing_changed
+    sync_company_ranks([instance.pk])
+    invalidate_company_listing(
+        [old and old["category_id"], instance.category_id]
+    )
+
+
+@receiver(post_delete, sender=Company)
+def on_company_delete(sender, instance, **kwargs):
+    sync_company_ranks([instance.pk])
+    invalidate_company_listing([instance.category_id])
+
+
+@receiver(post_init, sender=CompanyCategory)
+def remember_category_slug(sender, instance, **kwargs):
+    instance._original_slug = instance.__dict__.get("slug")
+
+
+@receiver([post_save, post_delete], sender=CompanyCategory)
+def on_category_change(sender, instance, **kwargs):
+    # Category names are rendered in every listing page
+    bump_tags(
+        {"all", f"cat:{instance.slug}", f"cat:{instance._original_slug}"}
+    )
+    instance._original_slug = instance.slug
+
+
+@receiver(post_delete, sender=CompanyCategory)
+def on_category_delete(sender, instance, **kwargs):
+    # Companies are detached with a bulk SET NULL, no Company signals
+    category_id = instance.pk
+    transaction.on_commit(lambda: drop_category_index(category_id))
+
+
+# ------------------------------------
+# Membership cache invalidation
+# ------------------------------------
+@receiver([post_save, post_delete], sender=CompanyMembership)
+def on_membership_change(sender, instance, **kwargs):
+    invalidate_company_roles([instance.user_id])
@@ -0,0 +1,11 @@
+from celery import shared_task
+
+from company.ranking import LOCK_KEY, rebuild_listing_index
+from CoreApi.locks import redis_lock
+
+
+@shared_task
+def rebuild_company_ranking():
+    # Catches updates lost to races between concurrent syncs
+    with redis_lock(LOCK_KEY, timeout=300) as acquired:
+        return rebuild_listing_index() if acquired else None
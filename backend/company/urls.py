@@ -11,6 +11,8 @@ from .views import (
     CompanyMyReviewAPIView,
     CompanySuggestionCreateView,
     CompanySitemapAPIView,
+    CompanyViewStatsAPIView,
+    CompanyDashboardReviewBulkModerationView,
 )
 
 urlpatterns = [
@@ -38,11 +40,21 @@ urlpatterns = [
         CompanyMyReviewAPIView.as_view(),
         name="company-my-review",
     ),
+    path(
+        "<slug:slug>/dashboard/reviews/bulk/",
+        CompanyDashboardReviewBulkModerationView.as_view(),
+        name="company-dashboard-reviews-bulk",
+    ),
     path(
         "<slug:slug>/dashboard/reviews/",
         CompanyDashboardReviewAPIView.as_view(),
         name="company-dashboard-reviews",
     ),
+    path(
+        "<slug:slug>/dashboard/views/",
+        CompanyViewStatsAPIView.as_view(),
+        name="company-dashboard-views",
+    ),
     path(
         "<slug:slug>/logo/",
         CompanyLogoUpdateView.as_view(),
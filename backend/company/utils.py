@@ -1,22 +1,10 @@
-from django.db.models import Avg, Count
-from django.contrib.contenttypes.models import ContentType
-
-from review.models import Review
-from company.models import Company
+from review.aggregates import rebuild_company_ratings, AGGREGATE_FIELDS
 
 
 def recalculate_company_rating(company):
-    ct = ContentType.objects.get_for_model(Company)
-
-    stats = Review.objects.filter(
-        content_type=ct,
-        object_id=company.id,
-        moderation_status=Review.ModerationStatus.APPROVED,
-    ).aggregate(
-        avg=Avg("rating"),
-        count=Count("id"),
-    )
-
-    company.rating_average = stats["avg"] or 0
-    company.rating_count = stats["count"]
-    company.save(update_fields=["rating_average", "rating_count"])
+    """
+    Full recount for one company. Review saves keep the aggregates up to
+    date incrementally; use this only to repair drift.
+    """
+    rebuild_company_ratings([company.id])
+    company.refresh_from_db(fields=AGGREGATE_FIELDS)
@@ -1,6 +1,8 @@
 from django.shortcuts import get_object_or_404
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import F
+from django.db.models import Count, F, Max, Q
+from django.db.models.functions import TruncMonth
+from django.utils.dateparse import parse_date
 from rest_framework.views import APIView
 from rest_framework.generics import ListAPIView, RetrieveAPIView
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
@@ -9,7 +11,7 @@ from rest_framework import status
 from rest_framework.parsers import MultiPartParser, FormParser
 from .pagination import ReviewDashboardPagination
 from rest_framework.exceptions import PermissionDenied
-from company.models import Company
+from company.models import Company, CompanyCategory
 from company.pagination import CompanyPagination
 from company.serializers import (
     CompanyListSerializer,
@@ -20,24 +22,33 @@ from company.serializers import (
     BusinessOnboardingSerializer,
 )
 from django.contrib.postgres.search import (
+    SearchHeadline,
     SearchQuery,
     SearchRank,
 )
 from company.permissions import user_can_manage_company
 from django.db import IntegrityError, transaction
 from review.serializers import ReviewSerializer, ReviewCreateSerializer,ReviewDashboardSerializer
-from review.services import get_reviews_for_object
+from review.serializers import ReviewBulkModerationSerializer, ReviewDashboardSearchSerializer
+from review.serializers import HIGHLIGHT_START, HIGHLIGHT_STOP
+from review.services import (
+    get_public_reviews_payload,
+    bulk_moderate_reviews,
+)
 from review.models import Review
 from review.views import CompanyReviewUpdateAPIView
 from rest_framework.exceptions import ValidationError
 from urllib.parse import urlparse
 from django.db.models.expressions import OrderBy
-from django.core.cache import cache
-from company.models import CompanySuggestion
 from company.serializers import CompanySuggestionSerializer
 from rest_framework.permissions import AllowAny
-from django.utils.timezone import now
-from datetime import timedelta
+from CoreApi.throttling import RateLimitThrottle, get_client_ip
+from analytics.counters import get_view_stats
+from analytics.mixins import RecordViewMixin
+from django.core.cache import cache
+from company.listing import get_listing_cache_key, LISTING_CACHE_SECONDS
+from CoreApi.conditional import ConditionalGetMixin
+from company.ranking import RankedCompanyList, ensure_listing_index
 
 
 
@@ -50,50 +61,84 @@ class CompanyListAPIView(ListAPIView):
     pagination_class = CompanyPagination
 
     def get_queryset(self):
-        qs = Company.objects.filter(is_active=True)
+        category_id = None
 
         category = self.request.query_params.get("category")
         if category:
-            qs = qs.filter(category__slug=category)
+            category_id = (
+                CompanyCategory.objects.filter(slug=category)
+                .values_list("pk", flat=True)
+                .first()
+            )
+            if category_id is None:
+                return Company.objects.none()
+
+        # Pages come straight out of the precomputed ranking; Postgres
+        # only while the index is being built (see company.ranking)
+        if ensure_listing_index():
+            return RankedCompanyList(category_id)
+
+        qs = Company.objects.filter(is_active=True)
+        if category_id is not None:
+            qs = qs.filter(category_id=category_id)
 
         qs = qs.order_by(
             OrderBy(F("display_order"), nulls_last=True),
             "-rating_average",
             "-rating_count",
-        )
+            "pk",
+        ).select_related("category")
 
         return qs
 
+    def list(self, request, *args, **kwargs):
+        # Same page for every visitor: serve it from Redis until a
+        # company in the listing changes (see company.listing)
+        cache_key = get_listing_cache_key(request)
+
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+
+        response = super().list(request, *args, **kwargs)
+        cache.set(cache_key, response.data, LISTING_CACHE_SECONDS)
+        return response
+
 # ------------------------------------
 # Company Detail
 # ------------------------------------
-class CompanyDetailView(RetrieveAPIView):
+class CompanyDetailView(RecordViewMixin, ConditionalGetMixin, RetrieveAPIView):
     serializer_class = CompanyDetailSerializer
     lookup_field = "slug"
+    viewed_model = Company
 
     def get_queryset(self):
-        return Company.objects.filter(is_active=True)
-
-    def retrieve(self, request, *args, **kwargs):
-        company = self.get_object()
-
-        # Identify viewer
-        if request.user.is_authenticated:
-            viewer_id = f"user:{request.user.id}"
-        else:
-            ip = request.META.get("REMOTE_ADDR", "unknown")
-            viewer_id = f"ip:{ip}"
-
-        cache_key = f"company:view:{company.pk}:{viewer_id}"
-
-        # Count once per 24h
-        if not cache.get(cache_key):
-            Company.objects.filter(pk=company.pk).update(
-                view_count=F("view_count") + 1
+        return Company.objects.filter(is_active=True).select_related("category")
+
+    def get_validator_row(self, slug):
+        # Shared by the validators and the view counter
+        if not hasattr(self, "_validator_row"):
+            self._validator_row = (
+                self.get_queryset()
+                .filter(slug=slug)
+                .values_list(
+                    "pk", "updated_at", "rating_count", "rating_sum", "category__name"
+                )
+                .first()
             )
-            cache.set(cache_key, True, 60 * 60 * 24)
+        return self._validator_row
 
-        return super().retrieve(request, *args, **kwargs)
+    def get_validators(self, request, *args, **kwargs):
+        # Rating writes bump updated_at too (see review.aggregates); the
+        # category name is rendered but lives on another row
+        row = self.get_validator_row(kwargs["slug"])
+        if row is None:
+            return None, None
+        return row, row[1]
+
+    def get_viewed_pk(self, request, *args, **kwargs):
+        row = self.get_validator_row(kwargs["slug"])
+        return row[0] if row else None
 
 
 # ------------------------------------
@@ -109,28 +154,20 @@ class CompanyReviewAPIView(APIView):
             is_active=True,
         )
 
-        page = int(request.query_params.get("page", 1))
-        page_size = int(request.query_params.get("page_size", 4))
-
-        data = get_reviews_for_object(
-            obj=company,
-            page=page,
-            page_size=page_size,
-        )
-
-        reviews_serializer = ReviewSerializer(
-            data["results"],
-            many=True,
-            context={"request": request},
-        )
+        try:
+            payload = get_public_reviews_payload(
+                company,
+                request.query_params,
+                default_page_size=4,
+                context={"request": request},
+            )
+        except ValueError as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        return Response(
-            {
-                "count": data["count"],
-                "results": reviews_serializer.data,
-            },
-            status=status.HTTP_200_OK,
-        )
+        return Response(payload, status=status.HTTP_200_OK)
     
     def post(self, request, slug):
         if not request.user.is_authenticated:
@@ -327,7 +364,8 @@ class CompanyDashboardReviewAPIView(ListAPIView):
     Dashboard-only review listing with:
     - pagination
     - moderation status filter
-    - PostgreSQL full-text search
+    - PostgreSQL full-text search with highlighted snippets
+    - rating (?rating=4,5) and date (?date_from=&date_to=) facets
     """
 
     permission_classes = [IsAuthenticated]
@@ -335,46 +373,224 @@ class CompanyDashboardReviewAPIView(ListAPIView):
     pagination_class = ReviewDashboardPagination
 
     def get_company(self):
-        company = get_object_or_404(Company, slug=self.kwargs["slug"])
-
-        if not user_can_manage_company(self.request.user, company):
-            raise PermissionDenied("Access denied")
-
-        return company
-
-    def get_queryset(self):
+        # Used by both the page and the facet queries
+        if not hasattr(self, "_company"):
+            company = get_object_or_404(Company, slug=self.kwargs["slug"])
+
+            if not user_can_manage_company(self.request.user, company):
+                raise PermissionDenied("Access denied")
+
+            self._company = company
+
+        return self._company
+
+    def get_serializer_class(self):
+        if self.get_search_query() is not None:
+            return ReviewDashboardSearchSerializer
+        return super().get_serializer_class()
+
+    def get_search_query(self):
+        search = self.request.query_params.get("search", "").strip()
+        if not search:
+            return None
+        return SearchQuery(search, search_type="websearch")
+
+    def get_facet_filters(self):
+        """
+        Q objects for the rating and date facets, keyed by facet.
+        """
+        params = self.request.query_params
+        filters = {}
+
+        ratings = params.get("rating")
+        if ratings:
+            try:
+                filters["rating"] = Q(
+                    rating__in=[int(r) for r in ratings.split(",") if r.strip()]
+                )
+            except ValueError:
+                raise ValidationError({"rating": "Expected comma separated stars"})
+
+        dates = Q()
+        for param, lookup in (("date_from", "gte"), ("date_to", "lte")):
+            if params.get(param):
+                value = parse_date(params[param])
+                if value is None:
+                    raise ValidationError({param: "Expected YYYY-MM-DD"})
+                dates &= Q(**{f"created_at__date__{lookup}": value})
+        if dates:
+            filters["date"] = dates
+
+        return filters
+
+    def get_matching_reviews(self):
+        """
+        Company reviews narrowed by status and search, before facets.
+        """
         company = self.get_company()
         ct = ContentType.objects.get_for_model(Company)
 
-        qs = (
-            Review.objects
-            .filter(
-                content_type=ct,
-                object_id=company.id,
-            )
-            .select_related("user")
-            .prefetch_related("media", "reply")
-        )
+        qs = Review.objects.filter(content_type=ct, object_id=company.id)
 
         # 🔄 Moderation status filter
         status_filter = self.request.query_params.get("status")
         if status_filter:
             qs = qs.filter(moderation_status=status_filter)
 
-        # 🔍 Full-text search (GIN + search_vector)
-        search = self.request.query_params.get("search")
-        if search:
-            query = SearchQuery(search)
-            qs = (
-                qs.annotate(rank=SearchRank(F("search_vector"), query))
-                .filter(rank__gte=0.1)
-                .order_by("-rank", "-created_at")
-            )
-        else:
-            qs = qs.order_by("-created_at")
+        # 🔍 Full-text search: @@ narrows the rows through the
+        # (object_id, search_vector) GIN index before anything is ranked
+        query = self.get_search_query()
+        if query is not None:
+            qs = qs.filter(search_vector=query)
 
         return qs
 
+    def get_queryset(self):
+        qs = self.get_matching_reviews()
+
+        for facet_filter in self.get_facet_filters().values():
+            qs = qs.filter(facet_filter)
+
+        qs = qs.select_related("user", "reply").prefetch_related("media")
+
+        query = self.get_search_query()
+        if query is None:
+            return qs.order_by("-created_at")
+
+        # Markers, not tags; the serializer escapes the text around them
+        highlight = {"start_sel": HIGHLIGHT_START, "stop_sel": HIGHLIGHT_STOP}
+        return qs.annotate(
+            rank=SearchRank(F("search_vector"), query),
+            title_headline=SearchHeadline("title", query, **highlight),
+            body_headline=SearchHeadline(
+                "body", query, max_words=35, min_words=15, **highlight
+            ),
+        ).order_by("-rank", "-created_at")
+
+    def get_facets(self):
+        """
+        Counts per star and per month. Each facet applies the other
+        facet's filter but not its own, so selecting a rating still shows
+        the counts for the other ratings.
+        """
+        qs = self.get_matching_reviews()
+        filters = self.get_facet_filters()
+
+        ratings = qs.filter(filters.get("date", Q()))
+        months = qs.filter(filters.get("rating", Q()))
+
+        return {
+            "rating": {
+                str(row["rating"]): row["n"]
+                for row in ratings.values("rating")
+                .annotate(n=Count("id"))
+                .order_by("rating")
+            },
+            "month": [
+                {"month": row["month"].date().isoformat(), "count": row["n"]}
+                for row in months.annotate(month=TruncMonth("created_at"))
+                .values("month")
+                .annotate(n=Count("id"))
+                .order_by("-month")
+            ],
+        }
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        response.data["facets"] = self.get_facets()
+        return response
+
+# ------------------------------------
+# Company Review Bulk Moderation (Dashboard)
+# ------------------------------------
+class CompanyDashboardReviewBulkModerationView(APIView):
+    """
+    POST {"ids": [...], "action": "approve" | "reject"}
+
+    One authorization check, one status UPDATE and one rating update
+    for the whole batch. Returns a result per requested id.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, slug):
+        company = get_object_or_404(Company, slug=slug)
+
+        if not user_can_manage_company(request.user, company):
+            return Response(
+                {"detail": "Access denied"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        serializer = ReviewBulkModerationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        ids = serializer.validated_data["ids"]
+        moderation_status = serializer.validated_data["moderation_status"]
+
+        reviews = Review.objects.filter(
+            content_type=ContentType.objects.get_for_model(Company),
+            object_id=company.id,
+            pk__in=ids,
+        )
+
+        found = set(reviews.values_list("pk", flat=True))
+        changed = set(bulk_moderate_reviews(reviews, moderation_status))
+
+        results = []
+        for review_id in ids:
+            if review_id not in found:
+                result = "not_found"
+            elif review_id in changed:
+                result = moderation_status
+            else:
+                result = "unchanged"
+            results.append({"id": review_id, "result": result})
+
+        return Response(
+            {
+                "updated": len(changed),
+                "results": results,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+# ------------------------------------
+# Company View Stats (Dashboard)
+# ------------------------------------
+class CompanyViewStatsAPIView(APIView):
+    """
+    Daily unique viewers and total views for the last ?days=<n> days
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, slug):
+        company = get_object_or_404(Company, slug=slug)
+
+        if not user_can_manage_company(request.user, company):
+            return Response(
+                {"detail": "Access denied"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        try:
+            days = int(request.query_params.get("days", 30))
+        except ValueError:
+            days = 30
+
+        daily = get_view_stats(company, days=days)
+
+        return Response(
+            {
+                "view_count": company.view_count,
+                "daily": daily,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
 class CompanyMyReviewAPIView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -418,26 +634,16 @@ class CompanyMyReviewAPIView(APIView):
 # ------------------------------------
 class CompanySuggestionCreateView(APIView):
     permission_classes = [AllowAny]
+    # 5 per hour per IP, see RATE_LIMITS
+    throttle_classes = [RateLimitThrottle]
+    throttle_scope = "company-suggestion"
 
     def post(self, request):
         serializer = CompanySuggestionSerializer(data=request.data)
 
         serializer.is_valid(raise_exception=True)
 
-        # 🔒 Rate limit basic protection (per IP - 5 per hour)
-        ip_address = request.META.get("REMOTE_ADDR")
-        one_hour_ago = now() - timedelta(hours=1)
-
-        recent_count = CompanySuggestion.objects.filter(
-            ip_address=ip_address,
-            created_at__gte=one_hour_ago,
-        ).count()
-
-        if recent_count >= 5:
-            return Response(
-                {"detail": "Too many submissions. Please try again later."},
-                status=status.HTTP_429_TOO_MANY_REQUESTS,
-            )
+        ip_address = get_client_ip(request)
 
         try:
             with transaction.atomic():
@@ -460,13 +666,17 @@ class CompanySuggestionCreateView(APIView):
             status=status.HTTP_201_CREATED,
         )
 
-class CompanySitemapAPIView(APIView):
+class CompanySitemapAPIView(ConditionalGetMixin, APIView):
+
+    def get_queryset(self):
+        return Company.objects.filter(is_active=True)
+
+    def get_validators(self, request, *args, **kwargs):
+        # The count catches deactivated companies, which leave max() as is
+        stats = self.get_queryset().aggregate(n=Count("pk"), last=Max("updated_at"))
+        return (stats["n"], stats["last"]), stats["last"]
 
     def get(self, request):
-        companies = (
-            Company.objects
-            .filter(is_active=True)
-            .values("slug", "updated_at")
-        )
+        companies = self.get_queryset().values("slug", "updated_at")
 
         return Response(companies)
\ No newline at end of file
@@ -2,11 +2,15 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status, permissions
 
+from CoreApi.throttling import RateLimitThrottle, get_client_ip
+
 from .serializers import ContactMessageSerializer
 
 
 class ContactMessageCreateAPIView(APIView):
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [RateLimitThrottle]
+    throttle_scope = "contact"
 
     def post(self, request):
         serializer = ContactMessageSerializer(data=request.data)
@@ -38,7 +42,4 @@ class ContactMessageCreateAPIView(APIView):
         )
 
     def get_client_ip(self, request):
-        x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
-        if x_forwarded_for:
-            return x_forwarded_for.split(",")[0]
-        return request.META.get("REMOTE_ADDR")
+        return get_client_ip(request)
@@ -0,0 +1,264 @@
+# content/autocomplete.py
+"""
+Word-start autocomplete index for the typeahead search.
+
+For every word start in a company's name and tagline, or in a blog post's
+title, each prefix of the text from that word on (up to ``MAX_PREFIX``
+characters) gets a Redis sorted set listing the objects that contain it,
+scored by relevance. This is the ``~* '\\mq'`` match SearchView runs in
+Postgres, so a lookup is one ZREVRANGE on the set for the query plus one
+HMGET for the payloads, O(log N + limit).
+
+Name matches outrank tagline matches. Within a tier, companies are
+ordered by rating and blog posts by publication date. Each object keeps
+a set of the prefixes it was indexed under so it can be re-indexed
+incrementally from its post_save signal.
+"""
+
+import json
+import re
+
+from django.db import transaction
+from django_redis import get_redis_connection
+from redis.exceptions import WatchError
+
+from blog.models import BlogPost
+from company.models import Company
+from CoreApi.locks import redis_lock
+
+AUTOCOMPLETE_PREFIX = "autocomplete"
+
+MAX_PREFIX = 15
+
+READY_KEY = f"{AUTOCOMPLETE_PREFIX}:ready"
+LOCK_KEY = f"{AUTOCOMPLETE_PREFIX}:lock"
+
+REBUILD_BATCH_SIZE = 500
+
+# Score tiers; the remainder of the score orders objects within a tier
+_TIER = 10**12
+
+_WORD_START = re.compile(r"\b\w")
+
+
+def get_redis():
+    return get_redis_connection("default")
+
+
+def _key(*parts):
+    return ":".join([AUTOCOMPLETE_PREFIX, *map(str, parts)])
+
+
+def get_word_prefixes(text):
+    """
+    Every prefix of ``text`` starting at a word boundary, normalized the
+    same way as search queries.
+    """
+    text = " ".join(text.lower().split())
+
+    prefixes = set()
+    for match in _WORD_START.finditer(text):
+        tail = text[match.start() : match.start() + MAX_PREFIX]
+        prefixes.update(tail[:length].rstrip() for length in range(1, len(tail) + 1))
+    return prefixes
+
+
+def _company_entry(company):
+    if not company.is_active:
+        return None
+
+    rating = int((company.rating_average or 0) * 100) * 10**9
+    rating += min(company.rating_count or 0, 10**9 - 1)
+
+    return (
+        {"id": company.id, "name": company.name, "slug": company.slug},
+        [(company.name, 2 * _TIER + rating), (company.tagline, _TIER + rating)],
+    )
+
+
+def _blog_entry(post):
+    if post.status != BlogPost.Status.PUBLISHED:
+        return None
+
+    published = int(post.published_at.timestamp()) if post.published_at else 0
+
+    return (
+        {"id": post.id, "title": post.title, "slug": post.slug},
+        [(post.title, _TIER + published)],
+    )
+
+
+INDEXES = {
+    "company": (Company, _company_entry),
+    "blog": (BlogPost, _blog_entry),
+}
+
+
+def _write(pipe, kind, pk, entry, old_prefixes):
+    """
+    Queue the commands that replace ``pk``'s entries in ``kind``.
+    """
+    prefixes_key = _key(kind, "obj", pk)
+
+    for prefix in old_prefixes:
+        pipe.zrem(_key(kind, "p", prefix.decode()), pk)
+    pipe.delete(prefixes_key)
+
+    if entry is None:
+        pipe.hdel(_key(kind, "data"), pk)
+        return
+
+    payload, fields = entry
+
+    scores = {}
+    for text, score in fields:
+        for prefix in get_word_prefixes(text or ""):
+            scores[prefix] = max(score, scores.get(prefix, 0))
+
+    for prefix, score in scores.items():
+        pipe.zadd(_key(kind, "p", prefix), {pk: score})
+    if scores:
+        pipe.sadd(prefixes_key, *scores)
+    pipe.hset(_key(kind, "data"), pk, json.dumps(payload))
+
+
+def _replace(kind, entries):
+    """
+    Replace the entries of ``[(pk, entry)]`` in ``kind`` atomically.
+    """
+    if not entries:
+        return
+
+    conn = get_redis()
+    keys = [_key(kind, "obj", pk) for pk, _ in entries]
+
+    with conn.pipeline(transaction=True) as pipe:
+        while True:
+            # The old prefixes are read under WATCH: if a concurrent
+            # re-index swaps them before EXEC, EXEC fails and the swap
+            # is redone, so no prefix set is left with a stale member
+            pipe.watch(*keys)
+            try:
+                reads = conn.pipeline(transaction=False)
+                for key in keys:
+                    reads.smembers(key)
+                old = reads.execute()
+
+                pipe.multi()
+                for (pk, entry), old_prefixes in zip(entries, old):
+                    _write(pipe, kind, pk, entry, old_prefixes)
+                pipe.execute()
+                return
+            except WatchError:
+                continue
+
+
+def index_objects(kind, objects):
+    _, get_entry = INDEXES[kind]
+    _replace(kind, [(obj.pk, get_entry(obj)) for obj in objects])
+
+
+def remove_objects(kind, pks):
+    _replace(kind, [(pk, None) for pk in pks])
+
+
+def schedule_reindex(kind, pk):
+    """
+    Re-index one object from its committed row once the transaction
+    commits; objects that are gone or no longer listed are removed.
+    """
+
+    def reindex():
+        if not get_redis().exists(READY_KEY):
+            return
+
+        model, _ = INDEXES[kind]
+        obj = model.objects.filter(pk=pk).first()
+
+        if obj is None:
+            remove_objects(kind, [pk])
+        else:
+            index_objects(kind, [obj])
+
+    transaction.on_commit(reindex)
+
+
+def rebuild_autocomplete_index():
+    """
+    Re-index every object in place and drop entries whose rows are gone.
+    Returns ``{kind: indexed objects}``.
+    """
+    conn = get_redis()
+    counts = {}
+
+    for kind, (model, _) in INDEXES.items():
+        seen = set()
+        last_pk = 0
+
+        while True:
+            batch = list(
+                model.objects.filter(pk__gt=last_pk).order_by("pk")[
+                    :REBUILD_BATCH_SIZE
+                ]
+            )
+            if not batch:
+                break
+
+            index_objects(kind, batch)
+            seen.update(str(obj.pk) for obj in batch)
+            last_pk = batch[-1].pk
+
+        stale = [
+            pk.decode()
+            for pk in conn.hkeys(_key(kind, "data"))
+            if pk.decode() not in seen
+        ]
+        remove_objects(kind, stale)
+
+        counts[kind] = conn.hlen(_key(kind, "data"))
+
+    conn.set(READY_KEY, 1)
+    return counts
+
+
+def ensure_autocomplete_index():
+    """
+    True when the index can be read. Builds it on first use; returns
+    False while another process holds the build lock.
+    """
+    conn = get_redis()
+    if conn.exists(READY_KEY):
+        return True
+
+    with redis_lock(LOCK_KEY, timeout=600) as acquired:
+        if acquired and not conn.exists(READY_KEY):
+            rebuild_autocomplete_index()
+    return acquired
+
+
+def autocomplete(kind, query, limit=5):
+    """
+    Top ``limit`` payloads of ``kind`` with a word starting with the
+    normalized ``query``, best first.
+    """
+    conn = get_redis()
+
+    pks = conn.zrevrange(_key(kind, "p", query[:MAX_PREFIX]), 0, limit - 1)
+    if not pks:
+        return []
+
+    results = [
+        json.loads(payload)
+        for payload in conn.hmget(_key(kind, "data"), pks)
+        if payload is not None
+    ]
+
+    if len(query) > MAX_PREFIX:
+        # Only the first MAX_PREFIX characters are indexed
+        field = "name" if kind == "company" else "title"
+        pattern = re.compile(r"\b" + re.escape(query))
+        results = [
+            r for r in results if pattern.search(" ".join(r[field].lower().split()))
+        ]
+
+    return results
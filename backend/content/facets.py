@@ -0,0 +1,86 @@
+# content/facets.py
+"""
+Facet counts for company search.
+
+All facets come from a single grouped aggregate over the candidate set:
+the candidate query is wrapped in ``GROUP BY GROUPING SETS`` with one set
+per facet, so Postgres scans the candidates once instead of running one
+COUNT per facet.
+"""
+
+from django.db import connection
+from django.db.models import F
+from django.db.models.functions import Floor
+
+# Facet name -> grouped column(s); the first column is the facet value
+COMPANY_FACETS = {
+    "category": ("facet_category", "facet_category_name"),
+    "country": ("facet_country",),
+    "state": ("facet_state",),
+    "city": ("facet_city",),
+    "is_verified": ("facet_verified",),
+    "rating": ("facet_rating",),
+}
+
+MAX_FACET_VALUES = 20
+
+
+def get_company_facets(qs):
+    """
+    ``{facet: [{"value", "count"}, ...]}`` for the companies in ``qs``,
+    most frequent first.
+    """
+    candidates = qs.order_by().values(
+        facet_category=F("category__slug"),
+        facet_category_name=F("category__name"),
+        facet_country=F("country"),
+        facet_state=F("state"),
+        facet_city=F("city"),
+        facet_verified=F("is_verified"),
+        # Star bucket: 4 covers 4.00-4.99
+        facet_rating=Floor("rating_average"),
+    )
+    sql, params = candidates.query.sql_with_params()
+
+    columns = [columns[0] for columns in COMPANY_FACETS.values()]
+    grouping_sets = ", ".join(
+        f"({', '.join(columns)})" for columns in COMPANY_FACETS.values()
+    )
+    groupings = ", ".join(f"GROUPING({column})" for column in columns)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT facet_category_name, {', '.join(columns)}, {groupings}, "
+            f"COUNT(*) FROM ({sql}) AS candidates "
+            f"GROUP BY GROUPING SETS ({grouping_sets})",
+            params,
+        )
+        rows = cursor.fetchall()
+
+    facets = {name: [] for name in COMPANY_FACETS}
+    names = list(COMPANY_FACETS)
+    width = len(columns)
+
+    for row in rows:
+        category_name = row[0]
+        values = row[1 : 1 + width]
+        grouped = row[1 + width : 1 + 2 * width]
+        count = row[-1]
+
+        # GROUPING() is 0 for the column this row is grouped by
+        index = grouped.index(0)
+        value = values[index]
+        if value is None or value == "":
+            continue
+
+        entry = {"value": value, "count": count}
+        if names[index] == "category":
+            entry["label"] = category_name
+        elif names[index] == "rating":
+            entry["value"] = int(value)
+        facets[names[index]].append(entry)
+
+    return {
+        name: sorted(entries, key=lambda e: -e["count"])[:MAX_FACET_VALUES]
+        for name, entries in facets.items()
+    }
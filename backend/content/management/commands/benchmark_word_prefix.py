@@ -0,0 +1,85 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import BooleanField
+from django.db.models.expressions import RawSQL
+
+from company.models import Company
+from content.matching import word_prefix_q
+
+WORDS = (
+    "acme global tech technology telecom migration visa immigration "
+    "consulting partners legal services advisors international world "
+    "bridge harbor summit north south east west capital union express "
+    "pathway horizon atlas pioneer future trust first prime nova apex"
+).split()
+
+QUERIES = ("t", "te", "tech", "visa con", "global migration", "zzz")
+
+
+class Command(BaseCommand):
+    help = (
+        "Insert synthetic companies in a rolled-back transaction and compare "
+        "word-prefix matching by regex against the token-vector GIN index."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1_000_000)
+        parser.add_argument("--batch-size", type=int, default=10_000)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self.populate(options["rows"], options["batch_size"])
+
+            with connection.cursor() as cursor:
+                cursor.execute("ANALYZE company_company")
+
+            for q in QUERIES:
+                regex = Company.objects.filter(
+                    RawSQL("name ~* %s", [rf"\m{q}"], output_field=BooleanField())
+                )
+                tokens = Company.objects.filter(word_prefix_q("name_tokens", q))
+
+                self.stdout.write(
+                    f"{q!r:20} regex {self.measure(regex, options['repeat'])}"
+                    f"  |  tokens {self.measure(tokens, options['repeat'])}"
+                )
+
+            # Never keep the synthetic rows
+            transaction.set_rollback(True)
+
+    def populate(self, rows, batch_size):
+        rng = random.Random(0)
+        started = time.perf_counter()
+
+        for start in range(0, rows, batch_size):
+            Company.objects.bulk_create(
+                [
+                    Company(
+                        name=" ".join(rng.sample(WORDS, rng.randint(1, 4))).title(),
+                        slug=f"bench-company-{i}",
+                    )
+                    for i in range(start, min(start + batch_size, rows))
+                ]
+            )
+
+        self.stdout.write(
+            f"Inserted {rows} companies in {time.perf_counter() - started:.1f}s"
+        )
+
+    def measure(self, qs, repeat):
+        """
+        Median time of fetching the top 5 and counting all matches.
+        """
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            list(qs.values_list("pk", flat=True)[:5])
+            matches = qs.count()
+            timings.append(time.perf_counter() - started)
+
+        return f"{statistics.median(timings) * 1000:8.1f} ms ({matches} matches)"
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from content.sitemaps import build_sitemaps_locked
+
+
+class Command(BaseCommand):
+    help = (
+        "Regenerate the gzipped XML sitemap chunks whose rows changed since "
+        "the last build, and the sitemap index."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Rebuild every chunk, ignoring the previous manifest",
+        )
+
+    def handle(self, *args, **options):
+        built = build_sitemaps_locked(full=options["full"])
+
+        if built is None:
+            self.stdout.write(self.style.WARNING("A build is already running."))
+            return
+
+        for name in built:
+            self.stdout.write(f"Built {name}")
+        self.stdout.write(self.style.SUCCESS(f"{len(built)} chunks rebuilt."))
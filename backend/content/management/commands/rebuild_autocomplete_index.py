@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from content.tasks import rebuild_autocomplete
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the Redis word-start autocomplete index for company "
+        "names/taglines and blog post titles."
+    )
+
+    def handle(self, *args, **options):
+        counts = rebuild_autocomplete()
+
+        if counts is None:
+            self.stdout.write(self.style.WARNING("A rebuild is already running."))
+            return
+
+        for kind, count in counts.items():
+            self.stdout.write(f"{kind}: {count} indexed")
+        self.stdout.write(self.style.SUCCESS("Autocomplete index rebuilt."))
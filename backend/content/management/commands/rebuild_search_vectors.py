@@ -0,0 +1,129 @@
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import django
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Max, Min
+
+from content.search_index import get_redis, rebuild_search_vector_range
+
+TARGETS = {
+    "company": "company.company",
+    "blog": "blog.blogpost",
+    "review": "review.review",
+}
+
+
+def _init_worker():
+    # Forked workers must not share the parent's database socket
+    django.setup()
+    connections.close_all()
+
+
+def _rebuild_range(label, start, stop):
+    return start, rebuild_search_vector_range(label, start, stop)
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild search_vector for every row of the given models in "
+        "primary-key ranges, in parallel, with checkpoints so an "
+        "interrupted run can be resumed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="targets",
+            default=[],
+            choices=sorted(TARGETS),
+            help="Model to rebuild (repeatable, default: all)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=2000,
+            help="Primary keys per UPDATE; smaller batches hold row locks "
+            "for less time",
+        )
+        parser.add_argument("--workers", type=int, default=4)
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore checkpoints from a previous run",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1 or options["workers"] < 1:
+            raise CommandError("--batch-size and --workers must be positive")
+
+        for target in options["targets"] or sorted(TARGETS):
+            self.rebuild(
+                TARGETS[target],
+                options["batch_size"],
+                options["workers"],
+                options["restart"],
+            )
+
+    def rebuild(self, label, batch_size, workers, restart):
+        bounds = apps.get_model(label).objects.aggregate(
+            low=Min("pk"), high=Max("pk")
+        )
+        if bounds["low"] is None:
+            self.stdout.write(f"{label}: nothing to rebuild")
+            return
+
+        conn = get_redis()
+        # Checkpoints are per range layout, so a different batch size
+        # starts over instead of skipping the wrong ranges
+        checkpoint_key = f"search-index:rebuild:{label}:{batch_size}"
+        if restart:
+            conn.delete(checkpoint_key)
+
+        done = {int(start) for start in conn.smembers(checkpoint_key)}
+        ranges = [
+            (start, start + batch_size)
+            for start in range(bounds["low"], bounds["high"] + 1, batch_size)
+            if start not in done
+        ]
+
+        total = len(ranges) + len(done)
+        completed = len(done)
+        rows = 0
+        started = time.perf_counter()
+
+        self.stdout.write(
+            f"{label}: {len(ranges)} of {total} ranges to rebuild "
+            f"with {workers} workers"
+        )
+
+        # Don't let forked workers inherit an open connection
+        connections.close_all()
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker
+        ) as pool:
+            futures = [
+                pool.submit(_rebuild_range, label, start, stop)
+                for start, stop in ranges
+            ]
+
+            for future in as_completed(futures):
+                start, updated = future.result()
+                conn.sadd(checkpoint_key, start)
+
+                completed += 1
+                rows += updated
+
+                if completed % 50 == 0 or completed == total:
+                    elapsed = time.perf_counter() - started
+                    self.stdout.write(
+                        f"{label}: {completed}/{total} ranges, {rows} rows "
+                        f"({rows / elapsed if elapsed else 0:.0f} rows/s)"
+                    )
+
+        conn.delete(checkpoint_key)
+        self.stdout.write(self.style.SUCCESS(f"{label}: rebuilt {rows} rows"))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from content.search_index import reindex_all_search_vectors
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute search vectors for rows marked dirty by saves. To rebuild "
+        "every row, use rebuild_search_vectors."
+    )
+
+    def handle(self, *args, **options):
+        counts = reindex_all_search_vectors()
+        if not counts:
+            self.stdout.write(self.style.WARNING("A reindex is already running."))
+            return
+
+        for label, count in counts.items():
+            self.stdout.write(f"{label}: {count} reindexed")
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from content.search_cache import get_search_stats
+
+
+class Command(BaseCommand):
+    help = "Show daily hit ratio of the typeahead search cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=7)
+
+    def handle(self, *args, **options):
+        stats = get_search_stats(options["days"])
+
+        for day in stats:
+            ratio = "-" if day["hit_ratio"] is None else f"{day['hit_ratio']:.1%}"
+            self.stdout.write(
+                f"{day['date']}  hits={day['hits']}  misses={day['misses']}  "
+                f"ratio={ratio}"
+            )
+
+        hits = sum(day["hits"] for day in stats)
+        total = hits + sum(day["misses"] for day in stats)
+        if total:
+            self.stdout.write(self.style.SUCCESS(f"Overall: {hits / total:.1%}"))
@@ -0,0 +1,54 @@
+# content/matching.py
+"""
+Word-prefix matching on indexed token vectors.
+
+``Company.name_tokens`` and ``BlogPost.title_tokens`` are generated
+``to_tsvector('simple', ...)`` columns with GIN indexes. A query such as
+"acme te" becomes the tsquery ``'acme' <-> 'te':*``, i.e. the words in
+order with a prefix match on the last one. That is the same match as the
+regex ``\\macme te`` but answered from the index, and the user's input
+never reaches a regex or tsquery parser unescaped.
+"""
+
+import re
+
+from django.contrib.postgres.search import SearchQuery
+from django.db.models import BooleanField, ExpressionWrapper, Q, Value
+
+_WORD = re.compile(r"\w+")
+
+
+def get_prefix_tsquery(q):
+    """
+    Raw tsquery for a word-prefix match on ``q``, or None when ``q`` has
+    no word characters.
+    """
+    words = _WORD.findall(q.lower())
+    if not words:
+        return None
+
+    terms = [f"'{word}'" for word in words]
+    terms[-1] += ":*"
+    return " <-> ".join(terms)
+
+
+def word_prefix_q(field, q):
+    """
+    Filter on rows whose ``field`` token vector has a word run starting
+    with ``q``.
+    """
+    tsquery = get_prefix_tsquery(q)
+    if tsquery is None:
+        return Q(pk__in=[])
+
+    return Q(**{field: SearchQuery(tsquery, search_type="raw", config="simple")})
+
+
+def word_prefix_match(field, q):
+    """
+    Boolean annotation for ``word_prefix_q``.
+    """
+    if get_prefix_tsquery(q) is None:
+        return Value(False)
+
+    return ExpressionWrapper(word_prefix_q(field, q), output_field=BooleanField())
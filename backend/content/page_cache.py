@@ -0,0 +1,122 @@
+# content/page_cache.py
+"""
+Compiled page content.
+
+The merged ``{key: value}`` dict for a ``(page, country, locale)`` is
+cached in Redis and in a per-process LRU. Each page has a version in the
+cache that is part of every key; saving or deleting a Content row bumps
+the version of its page only, so other pages stay warm. A warm request
+costs one cache read for the version and no database queries.
+"""
+
+from functools import lru_cache
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+
+from CoreApi.versioning import bump_versions, get_version
+
+from .models import Content
+
+PAGE_CACHE_SECONDS = 60 * 60 * 24
+
+LOCAL_CACHE_SIZE = 512
+
+
+def _version_key(page):
+    return f"page-content:version:{page}"
+
+
+def get_page_version(page):
+    return get_version(_version_key(page))
+
+
+def compile_page_content(page, country=None, locale=None):
+    """
+    Published content for ``page``: global rows, overridden by rows for
+    ``country``. One query.
+    """
+    scope = Q(country__isnull=True)
+    if country:
+        scope |= Q(country=country)
+
+    qs = Content.objects.filter(scope, page=page, is_published=True)
+    if locale:
+        qs = qs.filter(locale=locale)
+
+    default_content = {}
+    country_content = {}
+    for key, value, row_country in qs.values_list("key", "value", "country"):
+        if row_country is None:
+            default_content[key] = value
+        else:
+            country_content[key] = value
+
+    # Country overrides default
+    return {**default_content, **country_content}
+
+
+def _content_key(page, version, country, locale):
+    return f"page-content:{page}:{version}:{country or ''}:{locale or ''}"
+
+
+@lru_cache(maxsize=LOCAL_CACHE_SIZE)
+def _get_compiled(page, version, country, locale):
+    # The version is part of the arguments, so stale entries are never
+    # returned and simply age out of the LRU
+    key = _content_key(page, version, country, locale)
+
+    content = cache.get(key)
+    if content is None:
+        content = compile_page_content(page, country, locale)
+        cache.set(key, content, PAGE_CACHE_SECONDS)
+    return content
+
+
+def get_page_content(page, country=None, locale=None):
+    return _get_compiled(
+        page, get_page_version(page), country or None, locale or None
+    )
+
+
+def invalidate_pages(pages):
+    pages = {page for page in pages if page}
+
+    def bump():
+        bump_versions(_version_key(page) for page in pages)
+
+    def precompile():
+        from content.tasks import precompile_page_content
+
+        for page in pages:
+            precompile_page_content.delay(page)
+
+    transaction.on_commit(bump)
+    # Warming is best effort; a cold entry is compiled on first request
+    transaction.on_commit(precompile, robust=True)
+
+
+def precompile_page(page):
+    """
+    Warm the Redis entries for every country/locale that has rows on
+    ``page``, so the first render after an edit is a cache hit too.
+    """
+    version = get_page_version(page)
+
+    variants = set(
+        Content.objects.filter(page=page, is_published=True).values_list(
+            "country", "locale"
+        )
+    )
+    locales = {locale for _, locale in variants}
+    countries = {country for country, _ in variants}
+
+    entries = {}
+    for country in countries | {None}:
+        for locale in locales | {None}:
+            entries[_content_key(page, version, country, locale)] = (
+                compile_page_content(page, country, locale)
+            )
+    cache.set_many(entries, PAGE_CACHE_SECONDS)
+    return len(entries)
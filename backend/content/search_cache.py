@@ -0,0 +1,103 @@
+# content/search_cache.py
+"""
+Result cache for the typeahead search.
+
+Queries are normalized (trimmed, lowercased, whitespace collapsed) before
+they reach Postgres, so "Tech ", "tech" and "TECH" share one entry. The
+search is case-insensitive already (``~*``, pg_trgm and tsquery all fold
+case), so normalizing does not change results.
+
+Entries live for a short TTL and embed a global version that is bumped
+whenever a searchable company or blog post changes, which orphans every
+cached result at once. Hits and misses are counted per UTC day in Redis.
+"""
+
+import hashlib
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from django_redis import get_redis_connection
+
+from CoreApi.versioning import bump_versions, get_version
+
+SEARCH_CACHE_SECONDS = 60
+SEARCH_STATS_RETENTION_DAYS = 30
+
+MAX_QUERY_LENGTH = 100
+
+VERSION_KEY = "search:version"
+
+
+def normalize_query(q):
+    return " ".join(q.lower().split())[:MAX_QUERY_LENGTH]
+
+
+def get_search_version():
+    return get_version(VERSION_KEY)
+
+
+def invalidate_search_cache():
+    transaction.on_commit(lambda: bump_versions([VERSION_KEY]))
+
+
+def get_search_cache_key(query):
+    digest = hashlib.sha1(query.encode()).hexdigest()
+    return f"search:{get_search_version()}:{digest}"
+
+
+def _stats_key(date):
+    return f"search:stats:{date.strftime('%Y%m%d')}"
+
+
+def record_lookup(hit):
+    key = _stats_key(timezone.now())
+
+    pipe = get_redis_connection("default").pipeline(transaction=False)
+    pipe.hincrby(key, "hits" if hit else "misses", 1)
+    pipe.expire(key, SEARCH_STATS_RETENTION_DAYS * 24 * 60 * 60)
+    pipe.execute()
+
+
+def get_cached_search(query, compute):
+    """
+    Cached result of ``compute(query)`` for a normalized query.
+    """
+    key = get_search_cache_key(query)
+
+    result = cache.get(key)
+    record_lookup(result is not None)
+
+    if result is None:
+        result = compute(query)
+        cache.set(key, result, SEARCH_CACHE_SECONDS)
+
+    return result
+
+
+def get_search_stats(days=7):
+    """
+    Daily hit/miss counts and hit ratio, oldest first.
+    """
+    days = max(1, min(days, SEARCH_STATS_RETENTION_DAYS))
+    today = timezone.now().date()
+    dates = [today - timedelta(days=offset) for offset in range(days - 1, -1, -1)]
+
+    pipe = get_redis_connection("default").pipeline(transaction=False)
+    for date in dates:
+        pipe.hmget(_stats_key(date), "hits", "misses")
+
+    stats = []
+    for date, (hits, misses) in zip(dates, pipe.execute()):
+        hits, misses = int(hits or 0), int(misses or 0)
+        total = hits + misses
+        stats.append(
+            {
+                "date": date.isoformat(),
+                "hits": hits,
+                "misses": misses,
+                "hit_ratio": round(hits / total, 4) if total else None,
+            }
+        )
+    return stats
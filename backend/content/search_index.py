@@ -0,0 +1,127 @@
+# content/search_index.py
+"""
+Deferred ``search_vector`` maintenance.
+
+Saves no longer recompute the vector inline. A save that changes one of
+the indexed fields adds the row id to a per-model dirty set in Redis once
+the transaction commits; saves that only touch counters, ratings or
+flags are skipped. A periodic Celery task drains the dirty sets and
+recomputes the vectors with one UPDATE per batch.
+"""
+
+from django.apps import apps
+from django.contrib.postgres.search import SearchVector
+from django.db import transaction
+from django_redis import get_redis_connection
+
+from content.search_cache import invalidate_search_cache
+from CoreApi.locks import redis_lock
+
+REINDEX_BATCH_SIZE = 500
+
+# label -> ((field, weight), ...)
+SEARCH_VECTORS = {
+    "blog.blogpost": (
+        ("title", "A"),
+        ("excerpt", "B"),
+        ("content", "C"),
+    ),
+    "company.company": (
+        # Core identity
+        ("name", "A"),
+        ("tagline", "A"),
+        ("description", "B"),
+        # Address / Contact
+        ("address_line_1", "C"),
+        ("address_line_2", "C"),
+        ("city", "B"),
+        ("state", "C"),
+        ("postal_code", "D"),
+        ("country", "B"),
+    ),
+    "review.review": (
+        ("title", "A"),
+        ("body", "B"),
+        ("author_name", "C"),
+    ),
+}
+
+
+def get_redis():
+    return get_redis_connection("default")
+
+
+def _key(*parts):
+    return ":".join(["search-index", *map(str, parts)])
+
+
+def get_search_vector(label):
+    vectors = [
+        SearchVector(field, weight=weight) for field, weight in SEARCH_VECTORS[label]
+    ]
+    vector = vectors[0]
+    for other in vectors[1:]:
+        vector = vector + other
+    return vector
+
+
+def get_indexed_fields(label):
+    return [field for field, _ in SEARCH_VECTORS[label]]
+
+
+def mark_dirty(label, pk):
+    transaction.on_commit(lambda: get_redis().sadd(_key("dirty", label), pk))
+
+
+def reindex_search_vectors(label):
+    """
+    Recompute vectors for the dirty rows of one model.
+    Returns the number of rows reindexed.
+    """
+    conn = get_redis()
+    dirty_key = _key("dirty", label)
+    indexing_key = _key("indexing", label)
+
+    # Ids still in the indexing set belong to a run that crashed; they
+    # are reindexed before any new dirty ids are taken.
+    if not conn.exists(indexing_key):
+        if not conn.exists(dirty_key):
+            return 0
+        conn.rename(dirty_key, indexing_key)
+
+    ids = sorted(int(pk) for pk in conn.smembers(indexing_key))
+
+    model = apps.get_model(label)
+    vector = get_search_vector(label)
+
+    for start in range(0, len(ids), REINDEX_BATCH_SIZE):
+        model.objects.filter(pk__in=ids[start : start + REINDEX_BATCH_SIZE]).update(
+            search_vector=vector
+        )
+
+    conn.delete(indexing_key)
+    return len(ids)
+
+
+def reindex_all_search_vectors():
+    with redis_lock(_key("lock"), timeout=300) as acquired:
+        if not acquired:
+            return {}
+        counts = {label: reindex_search_vectors(label) for label in SEARCH_VECTORS}
+
+    if counts["blog.blogpost"]:
+        # Blog results are ranked on the vector itself
+        invalidate_search_cache()
+    return counts
+
+
+
+def rebuild_search_vector_range(label, start, stop):
+    """
+    Recompute vectors for rows with ``start <= pk < stop`` in one short
+    autocommit UPDATE. Returns the number of rows updated.
+    """
+    model = apps.get_model(label)
+    return model.objects.filter(pk__gte=start, pk__lt=stop).update(
+        search_vector=get_search_vector(label)
+    )
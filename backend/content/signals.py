@@ -0,0 +1,37 @@
+# content/signals.py
+from django.db.models.signals import post_init, post_save, post_delete
+from django.dispatch import receiver
+
+from blog.models import BlogPost
+from company.models import Company
+from CoreApi.tracking import on_fields_changed
+from .models import Content
+from .page_cache import invalidate_pages
+from .search_cache import invalidate_search_cache
+
+# Company fields the typeahead matches on or returns
+COMPANY_SEARCH_FIELDS = ("name", "slug", "tagline", "is_active")
+
+
+@on_fields_changed(Company, COMPANY_SEARCH_FIELDS)
+def on_company_search_change(instance, **kwargs):
+    invalidate_search_cache()
+
+
+# Blog posts match on their whole search vector, so any save counts
+@receiver([post_save, post_delete], sender=BlogPost)
+@receiver(post_delete, sender=Company)
+def on_searchable_change(sender, instance, **kwargs):
+    invalidate_search_cache()
+
+
+@receiver(post_init, sender=Content)
+def remember_content_page(sender, instance, **kwargs):
+    instance._original_page = instance.__dict__.get("page")
+
+
+@receiver([post_save, post_delete], sender=Content)
+def on_content_change(sender, instance, **kwargs):
+    # A row moved to another page changes both pages
+    invalidate_pages({instance._original_page, instance.page})
+    instance._original_page = instance.page
@@ -0,0 +1,190 @@
+# content/sitemaps.py
+"""
+Pre-built XML sitemaps for companies and blog posts.
+
+Rows are split into chunks by primary-key range, ``SITEMAP_CHUNK_SIZE``
+ids per chunk, so no chunk can hold more than the 50k URLs the protocol
+allows. One grouped query fingerprints every chunk (row count, id sum,
+last update); only chunks whose fingerprint changed since the last build
+are regenerated, streaming their rows with ``.iterator()`` straight into
+a gzip buffer. Chunks and the sitemap index are stored gzipped in the
+cache and served as-is.
+"""
+
+import gzip
+import io
+from xml.sax.saxutils import escape
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, F, Max, Sum
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from blog.models import BlogPost
+from company.models import Company
+from CoreApi.locks import redis_lock
+
+SITEMAP_CHUNK_SIZE = 50_000
+
+MANIFEST_KEY = "sitemap:manifest"
+INDEX_KEY = "sitemap:index"
+LOCK_KEY = "sitemap:lock"
+
+XMLNS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+
+def _company_rows():
+    return Company.objects.filter(is_active=True), F("updated_at"), "/listing/{}/"
+
+
+def _blog_rows():
+    # Scheduled posts enter the sitemap when published_at passes
+    qs = BlogPost.objects.filter(
+        status=BlogPost.Status.PUBLISHED, published_at__lte=timezone.now()
+    )
+    return qs, Greatest("updated_at", "published_at"), "/blog/{}/"
+
+
+SITEMAPS = {
+    "company": _company_rows,
+    "blog": _blog_rows,
+}
+
+
+def get_base_url():
+    base = getattr(settings, "SITEMAP_BASE_URL", None) or settings.FRONTEND_URL
+    return (base or "").rstrip("/")
+
+
+def _chunk_key(name):
+    return f"sitemap:chunk:{name}"
+
+
+def get_chunk_fingerprints(kind):
+    """
+    ``{chunk_name: (count, id_sum, lastmod)}`` for the non-empty chunks
+    of one sitemap, from a single grouped query.
+    """
+    qs, lastmod, _ = SITEMAPS[kind]()
+
+    rows = (
+        qs.annotate(chunk=F("pk") / SITEMAP_CHUNK_SIZE)
+        .values("chunk")
+        .annotate(n=Count("pk"), id_sum=Sum("pk"), lastmod=Max(lastmod))
+        .order_by("chunk")
+    )
+    return {
+        f"{kind}-{row['chunk']}": (row["n"], row["id_sum"], row["lastmod"])
+        for row in rows
+    }
+
+
+def _gzip(write_body):
+    buffer = io.BytesIO()
+    with gzip.GzipFile(fileobj=buffer, mode="wb", mtime=0) as out:
+        write_body(out)
+    return buffer.getvalue()
+
+
+def build_chunk(kind, number):
+    qs, lastmod, path = SITEMAPS[kind]()
+    base = get_base_url()
+
+    rows = (
+        qs.filter(
+            pk__gte=number * SITEMAP_CHUNK_SIZE,
+            pk__lt=(number + 1) * SITEMAP_CHUNK_SIZE,
+        )
+        .annotate(sitemap_lastmod=lastmod)
+        .order_by("pk")
+        .values_list("slug", "sitemap_lastmod")
+    )
+
+    def write(out):
+        out.write(
+            f'<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<urlset xmlns="{XMLNS}">\n'.encode()
+        )
+        for slug, modified in rows.iterator(chunk_size=2000):
+            loc = escape(base + path.format(slug))
+            line = f"<url><loc>{loc}</loc>"
+            if modified:
+                line += f"<lastmod>{modified.date().isoformat()}</lastmod>"
+            out.write((line + "</url>\n").encode())
+        out.write(b"</urlset>\n")
+
+    return _gzip(write)
+
+
+def build_index(manifest):
+    base = get_base_url()
+
+    def write(out):
+        out.write(
+            f'<?xml version="1.0" encoding="UTF-8"?>\n'
+            f'<sitemapindex xmlns="{XMLNS}">\n'.encode()
+        )
+        for name in sorted(manifest):
+            loc = escape(f"{base}/api/content/sitemaps/{name}.xml")
+            line = f"<sitemap><loc>{loc}</loc>"
+            if manifest[name]["lastmod"]:
+                line += f"<lastmod>{manifest[name]['lastmod']}</lastmod>"
+            out.write((line + "</sitemap>\n").encode())
+        out.write(b"</sitemapindex>\n")
+
+    return _gzip(write)
+
+
+def build_sitemaps(full=False):
+    """
+    Regenerate changed chunks and the index. Returns the names of the
+    chunks that were (re)built.
+    """
+    old_manifest = {} if full else (cache.get(MANIFEST_KEY) or {})
+    manifest = {}
+    built = []
+
+    for kind in SITEMAPS:
+        for name, (count, id_sum, lastmod) in get_chunk_fingerprints(kind).items():
+            fingerprint = f"{count}:{id_sum}:{lastmod.isoformat() if lastmod else ''}"
+            manifest[name] = {
+                "fingerprint": fingerprint,
+                "lastmod": lastmod.date().isoformat() if lastmod else None,
+            }
+
+            previous = old_manifest.get(name)
+            if previous and previous["fingerprint"] == fingerprint:
+                continue
+
+            number = int(name.rsplit("-", 1)[1])
+            cache.set(_chunk_key(name), build_chunk(kind, number), None)
+            built.append(name)
+
+    for name in set(old_manifest) - set(manifest):
+        cache.delete(_chunk_key(name))
+
+    cache.set(INDEX_KEY, build_index(manifest), None)
+    cache.set(MANIFEST_KEY, manifest, None)
+    return built
+
+
+def build_sitemaps_locked(full=False):
+    """
+    ``build_sitemaps`` unless another process is already building;
+    returns None in that case.
+    """
+    with redis_lock(LOCK_KEY, timeout=600) as acquired:
+        return build_sitemaps(full) if acquired else None
+
+
+def get_sitemap_index():
+    index = cache.get(INDEX_KEY)
+    if index is None:
+        build_sitemaps_locked()
+        index = cache.get(INDEX_KEY)
+    return index
+
+
+def get_sitemap_chunk(name):
+    return cache.get(_chunk_key(name))
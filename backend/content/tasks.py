@@ -0,0 +1,29 @@
+from celery import shared_task
+
+from content.autocomplete import LOCK_KEY, rebuild_autocomplete_index
+from content.page_cache import precompile_page
+from content.search_index import reindex_all_search_vectors
+from content.sitemaps import build_sitemaps_locked
+from CoreApi.locks import redis_lock
+
+
+@shared_task
+def rebuild_autocomplete():
+    # Refreshes rating-based scores, which change without a post_save
+    with redis_lock(LOCK_KEY, timeout=600) as acquired:
+        return rebuild_autocomplete_index() if acquired else None
+
+
+@shared_task
+def reindex_search_vectors():
+    return reindex_all_search_vectors()
+
+
+@shared_task
+def precompile_page_content(page):
+    return precompile_page(page)
+
+
+@shared_task
+def build_sitemaps():
+    return build_sitemaps_locked()
@@ -1,8 +1,22 @@
 from django.urls import path
-from .views import PageContentView,SearchView,FullSearchView
+from .views import (
+    PageContentView,
+    SearchView,
+    FullSearchView,
+    CompanySearchView,
+    SitemapIndexView,
+    SitemapChunkView,
+)
 
 urlpatterns = [
     path("search/", SearchView.as_view(), name="global-search"),
     path("full-search/", FullSearchView.as_view(), name="global-search-full"),
+    path("search/companies/", CompanySearchView.as_view(), name="company-search"),
+    path("sitemaps/index.xml", SitemapIndexView.as_view(), name="sitemap-index"),
+    path(
+        "sitemaps/<slug:name>.xml",
+        SitemapChunkView.as_view(),
+        name="sitemap-chunk",
+    ),
     path("<str:page>/", PageContentView.as_view()),
 ]
@@ -1,6 +1,16 @@
+import gzip
+
+from django.http import Http404, HttpResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from .models import Content
+from .page_cache import get_page_content, get_page_version
+from CoreApi.conditional import ConditionalGetMixin
+from .search_cache import get_cached_search, normalize_query
+from .autocomplete import autocomplete, ensure_autocomplete_index
+from .matching import word_prefix_match, word_prefix_q
+from .facets import get_company_facets
+from .sitemaps import get_sitemap_chunk, get_sitemap_index
+from rest_framework.exceptions import ValidationError
 from django.contrib.postgres.search import (
     SearchQuery,
     SearchRank,
@@ -9,7 +19,6 @@ from django.contrib.postgres.search import (
 from blog.models import BlogPost
 from company.models import Company
 from django.db import models
-from django.db.models.expressions import RawSQL
 
 from django.db.models import (
     Q,
@@ -17,54 +26,139 @@ from django.db.models import (
     Case,
     When,
     IntegerField,
-    Avg,
     Count,
+    Window,
 )
 
 
-class PageContentView(APIView):
+def page_with_total(qs, offset, limit):
+    """
+    One page of ``qs`` plus the total number of matches, from a single
+    query: the total rides along on every row as COUNT(*) OVER ().
+    """
+    rows = list(
+        qs.annotate(total=Window(Count("pk")))[offset : offset + limit]
+    )
+    if rows:
+        return rows, rows[0].total
+
+    # Past the last page there is no row to read the total from
+    return rows, qs.count() if offset else 0
+
+
+def company_search_queryset(q):
+    """
+    Active companies matching ``q`` by word prefix or trigram similarity,
+    best first. An empty ``q`` matches every active company.
+    """
+    qs = Company.objects.filter(is_active=True)
+
+    if not q:
+        return qs.order_by("-rating_average", "-rating_count", "pk")
+
+    allow_trigram = len(q) >= 2
+
+    return (
+        qs.annotate(
+            similarity=(
+                TrigramSimilarity("name", q) if allow_trigram else Value(0.0)
+            ),
+            word_prefix=word_prefix_match("name_tokens", q),
+        )
+        .filter(
+            word_prefix_q("name_tokens", q)
+            | (Q(similarity__gt=0.45) if allow_trigram else Q())
+        )
+        .order_by(
+            Case(
+                When(word_prefix=True, then=0),
+                default=1,
+                output_field=IntegerField(),
+            ),
+            "-similarity",
+            "-rating_average",
+            "-rating_count",
+        )
+    )
+
+
+def serialize_company_hit(request, c):
+    return {
+        "id": c.id,
+        "slug": c.slug,
+        "name": c.name,
+        "tagline": c.tagline,
+        "rating_average": float(c.rating_average or 0),
+        "rating_count": c.rating_count or 0,
+        "city": c.city,
+        "country": c.country,
+        "logo": (request.build_absolute_uri(c.logo.url) if c.logo else None),
+    }
+
+
+class PageContentView(ConditionalGetMixin, APIView):
     """
     Fetch page content.
     - Returns country-specific content where available.
     - Falls back to default content for missing keys.
     """
 
+    def get_validators(self, request, page):
+        # The page version changes whenever a Content row of the page does
+        params = request.query_params
+        return (
+            (page, get_page_version(page), params.get("country"), params.get("locale")),
+            None,
+        )
+
     def get(self, request, page):
         country = request.query_params.get("country")
+        locale = request.query_params.get("locale")
 
-        # 1️⃣ Fetch all content for the page, both country-specific and default
-        all_content_qs = Content.objects.filter(page=page, is_published=True)
-
-        # 2️⃣ Separate default and country-specific
-        default_content = {
-            item.key: item.value
-            for item in all_content_qs.filter(country__isnull=True)
-        }
+        # Merged once per (page, country, locale) and cached until a
+        # Content row of this page changes (see content.page_cache)
+        return Response(get_page_content(page, country, locale))
 
-        country_content = {}
-        if country:
-            country_content = {
-                item.key: item.value
-                for item in all_content_qs.filter(country=country)
-            }
-
-        # 3️⃣ Merge: country overrides default
-        merged_content = {**default_content, **country_content}
-
-        return Response(merged_content)
-    
 
 class SearchView(APIView):
+    SEARCH_LIMIT = 5
+
     authentication_classes = []
     permission_classes = []
 
     def get(self, request):
-        q = request.query_params.get("q", "").strip()
-        q_len = len(q)
+        q = normalize_query(request.query_params.get("q", ""))
 
         if not q:
             return Response({"blogs": [], "companies": []})
 
+        # Hit on every keystroke: identical queries skip Postgres
+        return Response(get_cached_search(q, self.search))
+
+    def search(self, q):
+        # Word-start matches come from the autocomplete index; Postgres
+        # only runs for a section that needs fuzzy matches to fill it
+        blog_hits, company_hits = [], []
+        if ensure_autocomplete_index():
+            blog_hits = autocomplete("blog", q, self.SEARCH_LIMIT)
+            company_hits = autocomplete("company", q, self.SEARCH_LIMIT)
+
+        return {
+            "blogs": (
+                blog_hits
+                if len(blog_hits) == self.SEARCH_LIMIT
+                else self.search_blogs(q)
+            ),
+            "companies": (
+                company_hits
+                if len(company_hits) == self.SEARCH_LIMIT
+                else self.search_companies(q)
+            ),
+        }
+
+    def search_blogs(self, q):
+        q_len = len(q)
+
         allow_trigram = q_len >= 2
         allow_fts_blog = q_len >= 3
 
@@ -84,13 +178,10 @@ class SearchView(APIView):
                     if allow_fts_blog
                     else models.Value(0.0)
                 ),
-                word_prefix=RawSQL(
-                    "title ~* %s",
-                    [rf"\m{q}"],
-                ),
+                word_prefix=word_prefix_match("title_tokens", q),
             )
             .filter(
-                Q(word_prefix=True)
+                word_prefix_q("title_tokens", q)
                 | (Q(similarity__gt=0.35) if allow_trigram else Q())
                 | (Q(rank__gt=0.15) if allow_fts_blog else Q())
             )
@@ -103,50 +194,14 @@ class SearchView(APIView):
                 "-rank",
                 "-similarity",
                 "-published_at",
-            )[:5]
+            )[:self.SEARCH_LIMIT]
         )
 
-        # ======================
-        # COMPANY SEARCH (FIXED)
-        # ======================
-        companies = (
-            Company.objects.filter(is_active=True)
-            .annotate(
-                similarity=(
-                    TrigramSimilarity("name", q) if allow_trigram else models.Value(0.0)
-                ),
-                word_prefix=RawSQL(
-                    "name ~* %s",
-                    [rf"\m{q}"],
-                ),
-            )
-            .filter(
-                # ✅ word-start match (Technology, Tech, Telecom)
-                Q(word_prefix=True)
-                | (Q(similarity__gt=0.45) if allow_trigram else Q())
-            )
-            .order_by(
-                models.Case(
-                    models.When(word_prefix=True, then=0),
-                    default=1,
-                    output_field=models.IntegerField(),
-                ),
-                "-similarity",
-                "-rating_average",
-                "-rating_count",
-            )[:5]
-        )
+        return [{"id": b.id, "title": b.title, "slug": b.slug} for b in blogs]
 
-        return Response(
-            {
-                "blogs": [
-                    {"id": b.id, "title": b.title, "slug": b.slug} for b in blogs
-                ],
-                "companies": [
-                    {"id": c.id, "name": c.name, "slug": c.slug} for c in companies
-                ],
-            }
-        )
+    def search_companies(self, q):
+        companies = company_search_queryset(q)[: self.SEARCH_LIMIT]
+        return [{"id": c.id, "name": c.name, "slug": c.slug} for c in companies]
 
 
 class FullSearchView(APIView):
@@ -197,12 +252,10 @@ class FullSearchView(APIView):
                     if allow_fts_blog
                     else Value(0.0)
                 ),
-                word_prefix=RawSQL("blog_blogpost.title ~* %s", [rf"\m{q}"]),
-                avg_rating=Avg("reviews__rating"),
-                review_count=Count("reviews"),
+                word_prefix=word_prefix_match("title_tokens", q),
             )
             .filter(
-                Q(word_prefix=True)
+                word_prefix_q("title_tokens", q)
                 | (Q(similarity__gt=0.35) if allow_trigram else Q())
                 | (Q(rank__gt=0.15) if allow_fts_blog else Q())
             )
@@ -216,10 +269,10 @@ class FullSearchView(APIView):
                 "-similarity",
                 "-published_at",
             )
+            .select_related("category", "author")
         )
 
-        total_blogs = blogs_qs.count()
-        blogs = blogs_qs[offset : offset + limit]
+        blogs, total_blogs = page_with_total(blogs_qs, offset, limit)
 
         blog_results = [
             {
@@ -234,8 +287,8 @@ class FullSearchView(APIView):
                     b.published_at.strftime("%b %d, %Y") if b.published_at else ""
                 ),
                 "views": b.view_count or 0,
-                "rating": 0,  # blogs don't have ratings yet
-                "reviewCount": 0,  # safe default
+                "rating": float(b.rating_average or 0),
+                "reviewCount": b.rating_count or 0,
             }
             for b in blogs
         ]
@@ -243,46 +296,11 @@ class FullSearchView(APIView):
         # =====================================================
         # COMPANY SEARCH (LOGIC UNCHANGED)
         # =====================================================
-        companies_qs = (
-            Company.objects.filter(is_active=True)
-            .annotate(
-                similarity=(
-                    TrigramSimilarity("name", q) if allow_trigram else Value(0.0)
-                ),
-                word_prefix=RawSQL("name ~* %s", [rf"\m{q}"]),
-            )
-            .filter(
-                Q(word_prefix=True) | (Q(similarity__gt=0.45) if allow_trigram else Q())
-            )
-            .order_by(
-                Case(
-                    When(word_prefix=True, then=0),
-                    default=1,
-                    output_field=IntegerField(),
-                ),
-                "-similarity",
-                "-rating_average",
-                "-rating_count",
-            )
-        )
+        companies_qs = company_search_queryset(q)
 
-        total_companies = companies_qs.count()
-        companies = companies_qs[offset : offset + limit]
+        companies, total_companies = page_with_total(companies_qs, offset, limit)
 
-        company_results = [
-            {
-                "id": c.id,
-                "slug": c.slug,
-                "name": c.name,
-                "tagline": c.tagline,
-                "rating_average": float(c.rating_average or 0),
-                "rating_count": c.rating_count or 0,
-                "city": c.city,
-                "country": c.country,
-                "logo": (request.build_absolute_uri(c.logo.url) if c.logo else None),
-            }
-            for c in companies
-        ]
+        company_results = [serialize_company_hit(request, c) for c in companies]
 
         return Response(
             {
@@ -297,3 +315,104 @@ class FullSearchView(APIView):
                 },
             }
         )
+
+
+class CompanySearchView(APIView):
+    """
+    Company search with filters and facet counts in one response.
+    Filters: category (slug), country, state, city, verified (true/false)
+    and rating (minimum stars). Facets are counted over the filtered hits.
+    """
+
+    authentication_classes = []
+    permission_classes = []
+
+    FILTERS = {
+        "category": "category__slug",
+        "country": "country__iexact",
+        "state": "state__iexact",
+        "city": "city__iexact",
+    }
+
+    def get(self, request):
+        params = request.query_params
+        q = normalize_query(params.get("q", ""))
+
+        try:
+            page = max(int(params.get("page", 1)), 1)
+            limit = min(max(int(params.get("limit", 10)), 1), 50)
+            min_rating = int(params["rating"]) if params.get("rating") else None
+        except ValueError:
+            raise ValidationError("page, limit and rating must be integers")
+
+        qs = company_search_queryset(q)
+
+        for param, lookup in self.FILTERS.items():
+            if params.get(param):
+                qs = qs.filter(**{lookup: params[param]})
+
+        if params.get("verified") in ("true", "false"):
+            qs = qs.filter(is_verified=params["verified"] == "true")
+
+        if min_rating is not None:
+            qs = qs.filter(rating_average__gte=min_rating)
+
+        companies, total = page_with_total(qs, (page - 1) * limit, limit)
+
+        return Response(
+            {
+                "query": q,
+                "companies": [serialize_company_hit(request, c) for c in companies],
+                "facets": get_company_facets(qs),
+                "meta": {"page": page, "limit": limit, "total": total},
+            }
+        )
+
+
+def gzipped_xml_response(request, body):
+    """
+    Serve a pre-gzipped XML artifact, inflating it only for clients that
+    don't accept gzip.
+    """
+    if "gzip" in request.headers.get("Accept-Encoding", ""):
+        response = HttpResponse(body, content_type="application/xml")
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = HttpResponse(gzip.decompress(body), content_type="application/xml")
+
+    response.headers["Vary"] = "Accept-Encoding"
+    return response
+
+
+class SitemapIndexView(APIView):
+    """
+    GET /api/content/sitemaps/index.xml
+    Sitemap index pointing at the company and blog chunks.
+    """
+
+    authentication_classes = []
+    permission_classes = []
+
+    def get(self, request):
+        index = get_sitemap_index()
+        if index is None:
+            # First build is running in another process
+            return Response(status=503, headers={"Retry-After": "30"})
+
+        return gzipped_xml_response(request, index)
+
+
+class SitemapChunkView(APIView):
+    """
+    GET /api/content/sitemaps/<kind>-<n>.xml
+    """
+
+    authentication_classes = []
+    permission_classes = []
+
+    def get(self, request, name):
+        chunk = get_sitemap_chunk(name)
+        if chunk is None:
+            raise Http404
+
+        return gzipped_xml_response(request, chunk)
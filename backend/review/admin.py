@@ -3,7 +3,7 @@ from django.utils.html import format_html
 from django.contrib import messages
 from django.utils import timezone
 from .models import Review, ReviewReply, ReviewMedia, EmailTemplate
-from .tasks import send_review_approved_email, send_review_rejected_email
+from .services import bulk_moderate_reviews
 
 
 # =====================================================
@@ -289,38 +289,7 @@ class ReviewAdmin(admin.ModelAdmin):
     # Approve Reviews Action
     # ---------------------------------
     def approve_reviews(self, request, queryset):
-        reviews_to_approve = queryset.exclude(moderation_status="approved")
-
-        approved_count = 0
-        for review in reviews_to_approve:
-            review.moderation_status = "approved"
-            review.save()
-            approved_count += 1
-
-            if review.user and review.user.email:
-                try:
-                    send_review_approved_email.delay(review.user.id, review.id)
-                except Exception as e:
-                    self.message_user(
-                        request,
-                        f"Failed to send email for review {review.id}: {str(e)}",
-                        level=messages.WARNING,
-                    )
-
-        already_approved = queryset.filter(moderation_status="approved").count()
-
-        if approved_count > 0:
-            self.message_user(
-                request,
-                f"Successfully approved {approved_count} review(s). {already_approved} were already approved.",
-                level=messages.SUCCESS,
-            )
-        else:
-            self.message_user(
-                request,
-                f"No reviews to approve. {already_approved} review(s) were already approved.",
-                level=messages.WARNING,
-            )
+        self._bulk_moderate(request, queryset, Review.ModerationStatus.APPROVED)
 
     approve_reviews.short_description = "✅ Approve selected reviews"
 
@@ -328,40 +297,48 @@ class ReviewAdmin(admin.ModelAdmin):
     # Reject Reviews Action
     # ---------------------------------
     def reject_reviews(self, request, queryset):
-        reviews_to_reject = queryset.exclude(moderation_status="rejected")
-
-        rejected_count = 0
-        for review in reviews_to_reject:
-            review.moderation_status = "rejected"
-            review.save()
-            rejected_count += 1
-
-            if review.user and review.user.email:
-                try:
-                    send_review_rejected_email.delay(review.user.id, review.id)
-                except Exception as e:
-                    self.message_user(
-                        request,
-                        f"Failed to send email for review {review.id}: {str(e)}",
-                        level=messages.WARNING,
-                    )
-
-        already_rejected = queryset.filter(moderation_status="rejected").count()
-
-        if rejected_count > 0:
+        self._bulk_moderate(request, queryset, Review.ModerationStatus.REJECTED)
+
+    reject_reviews.short_description = "❌ Reject selected reviews"
+
+    # ---------------------------------
+    # Shared bulk moderation (one UPDATE, one rating pass per company)
+    # ---------------------------------
+    def _bulk_moderate(self, request, queryset, moderation_status):
+        verb = {
+            Review.ModerationStatus.APPROVED: "approve",
+            Review.ModerationStatus.REJECTED: "reject",
+        }[moderation_status]
+        label = f"{verb}d"
+        selected = queryset.count()
+
+        try:
+            changed = len(bulk_moderate_reviews(queryset, moderation_status))
+        except ValueError as e:
+            # Only the service's own validation; anything else is a bug or
+            # an outage and should surface as one
+            self.message_user(
+                request,
+                f"Failed to {verb} reviews: {str(e)}",
+                level=messages.ERROR,
+            )
+            return
+
+        already = selected - changed
+
+        if changed > 0:
             self.message_user(
                 request,
-                f"Successfully rejected {rejected_count} review(s). {already_rejected} were already rejected.",
+                f"Successfully {label} {changed} review(s). {already} were already {label}.",
                 level=messages.SUCCESS,
             )
         else:
             self.message_user(
                 request,
-                f"No reviews to reject. {already_rejected} review(s) were already rejected.",
+                f"No reviews to {verb}. {already} review(s) were already {label}.",
                 level=messages.WARNING,
             )
 
-    reject_reviews.short_description = "❌ Reject selected reviews"
 
 @admin.register(EmailTemplate)
 class EmailTemplateAdmin(admin.ModelAdmin):
@@ -0,0 +1,247 @@
+# review/aggregates.py
+"""
+Incremental rating aggregates.
+
+Company keeps a running sum, count and per-star counts of its approved
+reviews; BlogPost keeps the sum and count. Saving, moderating or deleting
+a review applies the difference between its old and new contribution in
+a single UPDATE, instead of re-aggregating every review of the target.
+``rebuild_ratings`` recomputes the totals from scratch when they drift.
+"""
+
+from collections import defaultdict
+from decimal import Decimal
+
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Count, DecimalField, ExpressionWrapper, F, Value
+from django.db.models.functions import Cast, Coalesce, NullIf, Now, Round
+from django.utils import timezone
+
+from blog.models import BlogPost
+from company.models import Company
+from company.listing import companies_listing_changed
+from .models import Review
+
+STAR_FIELDS = {
+    1: "rating_1_count",
+    2: "rating_2_count",
+    3: "rating_3_count",
+    4: "rating_4_count",
+    5: "rating_5_count",
+}
+
+BASE_AGGREGATE_FIELDS = ("rating_average", "rating_count", "rating_sum")
+
+AGGREGATE_FIELDS = (*BASE_AGGREGATE_FIELDS, *STAR_FIELDS.values())
+
+# Models whose reviews are aggregated, with the columns they keep
+RATED_MODELS = {
+    Company: AGGREGATE_FIELDS,
+    BlogPost: BASE_AGGREGATE_FIELDS,
+}
+
+STATE_FIELDS = ("content_type_id", "object_id", "moderation_status", "rating")
+
+
+def get_rating_state(values):
+    """
+    State tuple from a review, or from a ``{field: value}`` mapping of
+    ``STATE_FIELDS`` (e.g. the values it was loaded with).
+    """
+    if isinstance(values, dict):
+        return tuple(values[field] for field in STATE_FIELDS)
+    return tuple(getattr(values, field) for field in STATE_FIELDS)
+
+
+def get_contribution(state):
+    """
+    (content_type_id, object_id, rating) when a review in ``state``
+    counts towards a rating aggregate, otherwise None.
+    """
+    if state is None:
+        return None
+
+    content_type_id, object_id, moderation_status, rating = state
+
+    if (
+        ContentType.objects.get_for_id(content_type_id).model_class()
+        not in RATED_MODELS
+        or moderation_status != Review.ModerationStatus.APPROVED
+        or not rating
+    ):
+        return None
+
+    return content_type_id, object_id, int(rating)
+
+
+def add_contribution(deltas, contribution, sign):
+    if contribution is None:
+        return
+
+    content_type_id, object_id, rating = contribution
+    delta = deltas[content_type_id, object_id]
+    delta["count"] += sign
+    delta["sum"] += sign * rating
+    delta[rating] += sign
+
+
+def new_deltas():
+    return defaultdict(lambda: defaultdict(int))
+
+
+def apply_rating_deltas(deltas):
+    """
+    Apply ``{(content_type_id, object_id): {"count": n, "sum": n,
+    <star>: n}}`` with one UPDATE per target. Rows are locked in key
+    order.
+    """
+    decimal = DecimalField(max_digits=20, decimal_places=4)
+    changed_companies = []
+
+    for content_type_id, object_id in sorted(deltas):
+        delta = deltas[content_type_id, object_id]
+        if not any(delta.values()):
+            continue
+
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+
+        new_sum = F("rating_sum") + delta["sum"]
+        new_count = F("rating_count") + delta["count"]
+
+        updates = {
+            field: F(field) + delta[star]
+            for star, field in STAR_FIELDS.items()
+            if delta[star] and field in RATED_MODELS[model]
+        }
+        updates["rating_sum"] = new_sum
+        updates["rating_count"] = new_count
+        # The public page changed; keeps Last-Modified/sitemaps honest
+        updates["updated_at"] = Now()
+        updates["rating_average"] = Coalesce(
+            Round(
+                ExpressionWrapper(
+                    Cast(new_sum, decimal) / NullIf(new_count, 0),
+                    output_field=decimal,
+                ),
+                2,
+            ),
+            Value(Decimal("0")),
+            output_field=model._meta.get_field("rating_average"),
+        )
+
+        model.objects.filter(pk=object_id).update(**updates)
+        if model is Company:
+            changed_companies.append(object_id)
+
+    if changed_companies:
+        companies_listing_changed(changed_companies)
+
+
+def apply_review_change(old_state, new_state):
+    deltas = new_deltas()
+    add_contribution(deltas, get_contribution(old_state), -1)
+    add_contribution(deltas, get_contribution(new_state), +1)
+    apply_rating_deltas(deltas)
+
+
+def compute_ratings(model, object_ids):
+    """
+    Aggregate approved reviews of ``model`` rows ``object_ids`` with one
+    grouped query. Returns ``{object_id: {field: value}}`` for every id,
+    covering the fields in ``RATED_MODELS[model]``.
+    """
+    content_type = ContentType.objects.get_for_model(model)
+    fields = RATED_MODELS[model]
+
+    stars = {object_id: defaultdict(int) for object_id in object_ids}
+
+    rows = (
+        Review.objects.filter(
+            content_type=content_type,
+            object_id__in=object_ids,
+            moderation_status=Review.ModerationStatus.APPROVED,
+        )
+        .values("object_id", "rating")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+
+    for row in rows:
+        if row["rating"] in STAR_FIELDS:
+            stars[row["object_id"]][row["rating"]] = row["n"]
+
+    stats = {}
+    for object_id, counts in stars.items():
+        count = sum(counts.values())
+        total = sum(star * n for star, n in counts.items())
+
+        values = {
+            "rating_count": count,
+            "rating_sum": total,
+            "rating_average": (
+                round(Decimal(total) / count, 2) if count else Decimal("0.00")
+            ),
+        }
+        for star, field in STAR_FIELDS.items():
+            if field in fields:
+                values[field] = counts[star]
+
+        stats[object_id] = values
+
+    return stats
+
+
+def compute_company_ratings(company_ids):
+    return compute_ratings(Company, company_ids)
+
+
+def find_drifted_ratings(model, object_ids):
+    """
+    ``[(obj, expected)]`` for the ``model`` rows among ``object_ids``
+    whose stored aggregates differ from their approved reviews.
+    """
+    fields = RATED_MODELS[model]
+    stats = compute_ratings(model, object_ids)
+
+    return [
+        (obj, stats[obj.pk])
+        for obj in model.objects.filter(pk__in=object_ids).only("pk", *fields)
+        if any(getattr(obj, f) != stats[obj.pk][f] for f in fields)
+    ]
+
+
+def rebuild_ratings(model, object_ids):
+    """
+    Recompute aggregates from scratch for ``model`` rows ``object_ids``.
+    Returns the ids whose stored aggregates had drifted.
+    """
+    fields = RATED_MODELS[model]
+
+    drifted = []
+    for obj, expected in find_drifted_ratings(model, object_ids):
+        for field in fields:
+            setattr(obj, field, expected[field])
+        obj.updated_at = timezone.now()
+        drifted.append(obj)
+
+    model.objects.bulk_update(drifted, [*fields, "updated_at"], batch_size=500)
+
+    drifted_ids = [obj.pk for obj in drifted]
+    if drifted_ids and model is Company:
+        companies_listing_changed(drifted_ids)
+    return drifted_ids
+
+
+def rebuild_company_ratings(company_ids):
+    return rebuild_ratings(Company, company_ids)
+
+
+def rebuild_review_target(review):
+    """
+    Fallback for reviews whose previous state is unknown: rebuild the
+    aggregates of the object the review points at.
+    """
+    model = ContentType.objects.get_for_id(review.content_type_id).model_class()
+
+    if model in RATED_MODELS:
+        rebuild_ratings(model, [review.object_id])
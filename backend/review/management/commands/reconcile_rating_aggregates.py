@@ -0,0 +1,75 @@
+from django.core.management.base import BaseCommand
+
+from blog.models import BlogPost
+from company.models import Company
+from review.aggregates import rebuild_ratings
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild company and blog post rating aggregates (sum, count, "
+        "average, per-star counts) from approved reviews and report rows "
+        "that drifted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--company",
+            action="append",
+            dest="company_slugs",
+            default=[],
+            help="Company slug to reconcile (repeatable)",
+        )
+        parser.add_argument(
+            "--blog",
+            action="append",
+            dest="blog_slugs",
+            default=[],
+            help="Blog post slug to reconcile (repeatable)",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        targets = [
+            (Company, options["company_slugs"]),
+            (BlogPost, options["blog_slugs"]),
+        ]
+        # Naming any slug restricts the run to the named rows
+        selective = any(slugs for _, slugs in targets)
+
+        for model, slugs in targets:
+            if selective and not slugs:
+                continue
+
+            qs = model.objects.order_by("pk")
+            if slugs:
+                qs = qs.filter(slug__in=slugs)
+
+            self.reconcile(model, qs, options["batch_size"])
+
+    def reconcile(self, model, qs, batch_size):
+        label = model._meta.verbose_name
+        checked = 0
+        drifted = []
+        last_pk = 0
+
+        while True:
+            ids = list(
+                qs.filter(pk__gt=last_pk).values_list("pk", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+
+            drifted += rebuild_ratings(model, ids)
+            checked += len(ids)
+            last_pk = ids[-1]
+
+        for pk in drifted:
+            self.stdout.write(f"Repaired {label} #{pk}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Checked {checked} {model._meta.verbose_name_plural}, "
+                f"repaired {len(drifted)}."
+            )
+        )
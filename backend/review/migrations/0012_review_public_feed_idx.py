@@ -0,0 +1,22 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:30
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('review', '0011_alter_review_options'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='review',
+            index=models.Index(fields=['content_type', 'object_id', 'moderation_status', '-created_at', '-id'], name='review_public_feed_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.6 on 2026-10-18 09:39
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently, BtreeGinExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('review', '0012_review_public_feed_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        BtreeGinExtension(),
+        AddIndexConcurrently(
+            model_name='review',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['object_id', 'search_vector'], name='review_object_search_idx'),
+        ),
+    ]
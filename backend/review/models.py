@@ -92,7 +92,24 @@ class Review(models.Model):
         ]
         indexes = [
             GinIndex(fields=["search_vector"]),
+            # Dashboard search: one company's reviews matching a tsquery
+            # (needs btree_gin for object_id)
+            GinIndex(
+                fields=["object_id", "search_vector"],
+                name="review_object_search_idx",
+            ),
             models.Index(fields=["content_type", "object_id"]),
+            # Public feed: keyset pagination on (created_at, id)
+            models.Index(
+                fields=[
+                    "content_type",
+                    "object_id",
+                    "moderation_status",
+                    "-created_at",
+                    "-id",
+                ],
+                name="review_public_feed_idx",
+            ),
             models.Index(fields=["rating"]),
             models.Index(fields=["moderation_status"]),
         ]
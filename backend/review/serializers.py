@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from django.contrib.contenttypes.models import ContentType
+from django.utils.html import escape
 from rest_framework.validators import ValidationError
 from .models import Review, ReviewMedia
 from review.models import ReviewReply
@@ -223,6 +224,44 @@ class ReviewDashboardSerializer(serializers.ModelSerializer):
         return serializer.data
 
 
+# ts_headline markers: private-use characters, not HTML, so review text
+# can't smuggle markup into the snippet
+HIGHLIGHT_START = "\ue000"
+HIGHLIGHT_STOP = "\ue001"
+
+
+class HighlightField(serializers.CharField):
+    """
+    ts_headline snippet as safe HTML: the text is escaped, then the
+    markers become <mark> tags.
+    """
+
+    def to_representation(self, value):
+        return (
+            escape(value)
+            .replace(HIGHLIGHT_START, "<mark>")
+            .replace(HIGHLIGHT_STOP, "</mark>")
+        )
+
+
+class ReviewDashboardSearchSerializer(ReviewDashboardSerializer):
+    """
+    Dashboard search hit: the review plus its rank and HTML-escaped
+    ts_headline snippets (matches wrapped in <mark>).
+    """
+
+    rank = serializers.FloatField(read_only=True)
+    title_headline = HighlightField(read_only=True)
+    body_headline = HighlightField(read_only=True)
+
+    class Meta(ReviewDashboardSerializer.Meta):
+        fields = ReviewDashboardSerializer.Meta.fields + [
+            "rank",
+            "title_headline",
+            "body_headline",
+        ]
+
+
 # =========================================================
 # REVIEW MEDIA UPLOAD
 # =========================================================
@@ -278,3 +317,31 @@ class ReviewUpdateSerializer(serializers.ModelSerializer):
             "body",
             "delete_media_ids",
         )
+
+
+# =========================================================
+# REVIEW BULK MODERATION (DASHBOARD)
+# =========================================================
+
+class ReviewBulkModerationSerializer(serializers.Serializer):
+    MAX_IDS = 5000
+
+    ACTION_STATUSES = {
+        "approve": Review.ModerationStatus.APPROVED,
+        "reject": Review.ModerationStatus.REJECTED,
+    }
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=MAX_IDS,
+    )
+    action = serializers.ChoiceField(choices=list(ACTION_STATUSES))
+
+    def validate_ids(self, value):
+        # Keep request order, drop duplicates
+        return list(dict.fromkeys(value))
+
+    def validate(self, attrs):
+        attrs["moderation_status"] = self.ACTION_STATUSES[attrs["action"]]
+        return attrs
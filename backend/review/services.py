@@ -1,13 +1,41 @@
+import binascii
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+
 from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
 from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
 
 from .models import Review
+from .serializers import ReviewSerializer
+from .aggregates import (
+    add_contribution,
+    apply_rating_deltas,
+    get_contribution,
+    new_deltas,
+)
+from .tasks import send_review_moderation_emails
 
 
-def get_reviews_for_object(*, obj, page=1, page_size=10):
+REVIEW_COUNT_CACHE_SECONDS = 60 * 5
+
+
+def with_public_review_relations(qs):
     """
-    Generic review fetcher for ANY model (Company, Blog, Product, etc.)
-    Returns ONLY approved reviews (public-safe).
+    Query plan for ReviewSerializer: author and reply are joined in the
+    main query and media is prefetched in one extra query, so a page of
+    any size costs the same number of queries.
+    """
+    return qs.select_related("user", "reply").prefetch_related("media")
+
+
+def get_public_reviews_queryset(obj):
+    """
+    Approved reviews of ``obj`` in feed order. Matches the
+    (content_type, object_id, moderation_status, created_at, id) index.
     """
 
     content_type = ContentType.objects.get_for_model(obj, for_concrete_model=False)
@@ -19,10 +47,20 @@ def get_reviews_for_object(*, obj, page=1, page_size=10):
             object_id=obj.id,
             moderation_status=Review.ModerationStatus.APPROVED,
         )
-        .select_related("content_type")
-        .order_by("-created_at")
+        .order_by("-created_at", "-id")
     )
 
+    return with_public_review_relations(qs)
+
+
+def get_reviews_for_object(*, obj, page=1, page_size=10):
+    """
+    Generic review fetcher for ANY model (Company, Blog, Product, etc.)
+    Returns ONLY approved reviews (public-safe).
+    """
+
+    qs = get_public_reviews_queryset(obj)
+
     paginator = Paginator(qs, page_size)
     page_obj = paginator.get_page(page)
 
@@ -31,3 +69,194 @@ def get_reviews_for_object(*, obj, page=1, page_size=10):
         "num_pages": paginator.num_pages,
         "results": page_obj.object_list,
     }
+
+
+def encode_review_cursor(review):
+    raw = f"{review.created_at.isoformat()}|{review.id}"
+    return urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_review_cursor(cursor):
+    """
+    Returns (created_at, id). Raises ValueError on a malformed cursor.
+    """
+    try:
+        created_at, review_id = urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(review_id)
+    except (TypeError, ValueError, binascii.Error) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def get_approximate_review_count(obj):
+    """
+    Header count for cursor pages. Uses the denormalized rating_count
+    when the target has one, otherwise a short-lived cached COUNT(*).
+    """
+    rating_count = getattr(obj, "rating_count", None)
+    if rating_count is not None:
+        return rating_count
+
+    content_type = ContentType.objects.get_for_model(obj, for_concrete_model=False)
+    cache_key = f"reviews:count:{content_type.id}:{obj.id}"
+
+    return cache.get_or_set(
+        cache_key,
+        lambda: get_public_reviews_queryset(obj).count(),
+        REVIEW_COUNT_CACHE_SECONDS,
+    )
+
+
+def get_reviews_page_by_cursor(*, obj, cursor=None, page_size=10):
+    """
+    Keyset pagination on (created_at, id): every page is an index range
+    scan of ``page_size + 1`` rows, no OFFSET and no COUNT(*).
+    """
+
+    qs = get_public_reviews_queryset(obj)
+
+    if cursor:
+        created_at, review_id = decode_review_cursor(cursor)
+        qs = qs.filter(
+            Q(created_at__lt=created_at)
+            | Q(created_at=created_at, id__lt=review_id)
+        )
+
+    rows = list(qs[: page_size + 1])
+    results = rows[:page_size]
+
+    return {
+        "count": get_approximate_review_count(obj),
+        "next_cursor": (
+            encode_review_cursor(results[-1]) if len(rows) > page_size else None
+        ),
+        "results": results,
+    }
+
+
+MAX_REVIEW_PAGE_SIZE = 50
+
+
+def parse_review_page_size(value, default):
+    """
+    ``?page_size=`` as an int in 1..MAX_REVIEW_PAGE_SIZE. Raises
+    ValueError otherwise.
+    """
+    if value is None:
+        return default
+
+    try:
+        page_size = int(value)
+    except (TypeError, ValueError):
+        page_size = 0
+
+    if not 1 <= page_size <= MAX_REVIEW_PAGE_SIZE:
+        raise ValueError(
+            f"page_size must be between 1 and {MAX_REVIEW_PAGE_SIZE}"
+        )
+    return page_size
+
+
+def get_public_reviews_payload(obj, params, *, default_page_size, context=None):
+    """
+    Response body for a public review feed. ``?cursor=`` (empty for the
+    first page) switches to keyset pagination, otherwise ``?page=`` is
+    used. Raises ValueError with a client-facing message for a bad
+    page_size or cursor.
+    """
+    page_size = parse_review_page_size(params.get("page_size"), default_page_size)
+
+    if "cursor" in params:
+        data = get_reviews_page_by_cursor(
+            obj=obj,
+            cursor=params.get("cursor"),
+            page_size=page_size,
+        )
+    else:
+        data = get_reviews_for_object(
+            obj=obj,
+            page=params.get("page", 1),
+            page_size=page_size,
+        )
+
+    payload = {
+        "count": data["count"],
+        "results": ReviewSerializer(
+            data["results"], many=True, context=context or {}
+        ).data,
+    }
+    if "next_cursor" in data:
+        payload["next_cursor"] = data["next_cursor"]
+    return payload
+
+
+def bulk_moderate_reviews(reviews, moderation_status):
+    """
+    Move ``reviews`` (queryset or ids) to ``moderation_status`` with one
+    UPDATE. Rating aggregates of every affected company are adjusted
+    once, and notification emails are queued as a single task after
+    commit. Returns the ids of reviews whose status changed.
+
+    Raises ValueError for an unknown ``moderation_status``.
+    """
+
+    if moderation_status not in Review.ModerationStatus.values:
+        raise ValueError(f"Invalid moderation status: {moderation_status}")
+
+    if not isinstance(reviews, QuerySet):
+        reviews = Review.objects.filter(pk__in=list(reviews))
+
+    with transaction.atomic():
+        rows = list(
+            Review.objects
+            .filter(pk__in=reviews.values("pk"))
+            .exclude(moderation_status=moderation_status)
+            .order_by("pk")
+            .select_for_update()
+            .values_list(
+                "id",
+                "content_type_id",
+                "object_id",
+                "moderation_status",
+                "rating",
+                "user_id",
+            )
+        )
+
+        if not rows:
+            return []
+
+        ids = [row[0] for row in rows]
+
+        # queryset.update() skips post_save, so the deltas are applied here
+        Review.objects.filter(pk__in=ids).update(
+            moderation_status=moderation_status,
+            updated_at=timezone.now(),
+        )
+
+        deltas = new_deltas()
+        for _, content_type_id, object_id, old_status, rating, _ in rows:
+            add_contribution(
+                deltas,
+                get_contribution((content_type_id, object_id, old_status, rating)),
+                -1,
+            )
+            add_contribution(
+                deltas,
+                get_contribution(
+                    (content_type_id, object_id, moderation_status, rating)
+                ),
+                +1,
+            )
+        apply_rating_deltas(deltas)
+
+        notify_ids = [row[0] for row in rows if row[5]]
+        if notify_ids:
+            transaction.on_commit(
+                lambda: send_review_moderation_emails.delay(
+                    review_ids=notify_ids,
+                    moderation_status=moderation_status,
+                ),
+                robust=True,
+            )
+
+    return ids
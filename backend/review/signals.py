@@ -1,39 +1,35 @@
 # reviews/signals.py
 
-from django.db.models.signals import post_save, post_delete
+from django.db.models.signals import post_delete
 from django.dispatch import receiver
-from django.contrib.contenttypes.models import ContentType
-from django.db.models import Avg, Count
 
-from .models import Review
-from company.models import Company
-
-
-def update_company_rating(company: Company):
-    content_type = ContentType.objects.get_for_model(Company)
-
-    stats = Review.objects.filter(
-        content_type=content_type,
-        object_id=company.id,
-        moderation_status=Review.ModerationStatus.APPROVED,
-    ).aggregate(
-        avg=Avg("rating"),
-        count=Count("id"),
-    )
+from CoreApi.tracking import get_loaded_values, on_fields_changed
 
-    company.rating_average = round(stats["avg"] or 0, 2)
-    company.rating_count = stats["count"] or 0
-
-    company.save(update_fields=["rating_average", "rating_count"])
+from .models import Review
+from .aggregates import (
+    STATE_FIELDS,
+    apply_review_change,
+    get_rating_state,
+    rebuild_review_target,
+)
 
 
-@receiver(post_save, sender=Review)
-def on_review_save(sender, instance, **kwargs):
-    if isinstance(instance.content_object, Company):
-        update_company_rating(instance.content_object)
+@on_fields_changed(Review, STATE_FIELDS)
+def on_review_save(instance, old, created):
+    if old is None and not created:
+        # Loaded with deferred fields: the old contribution is unknown
+        rebuild_review_target(instance)
+    else:
+        apply_review_change(
+            old and get_rating_state(old), get_rating_state(instance)
+        )
 
 
 @receiver(post_delete, sender=Review)
 def on_review_delete(sender, instance, **kwargs):
-    if isinstance(instance.content_object, Company):
-        update_company_rating(instance.content_object)
+    old = get_loaded_values(instance, STATE_FIELDS)
+
+    if old is None:
+        rebuild_review_target(instance)
+    else:
+        apply_review_change(get_rating_state(old), None)
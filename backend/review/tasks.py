@@ -1,5 +1,7 @@
+from contextlib import suppress
+
 from celery import shared_task
-from django.core.mail import send_mail
+from django.core.mail import EmailMessage, get_connection, send_mail
 from django.conf import settings
 from django.template import Template, Context
 
@@ -41,3 +43,74 @@ def send_review_rejected_email(self, user_id, review_id):
         recipient_list=[user.email],
         fail_silently=False,
     )
+
+
+MODERATION_EMAIL_TEMPLATES = {
+    Review.ModerationStatus.APPROVED: "review_approved",
+    Review.ModerationStatus.REJECTED: "review_rejected",
+}
+
+
+def _close_quietly(connection):
+    with suppress(Exception):
+        connection.close()
+
+
+@shared_task(bind=True, autoretry_for=(Exception,), retry_backoff=30)
+def send_review_moderation_emails(self, review_ids, moderation_status):
+    """
+    One task per bulk moderation: compiles the template once and sends
+    the messages one at a time over one SMTP connection, reopened only
+    after a failed send. If some fail, only those reviews are retried,
+    so recipients that already got their email don't get it twice.
+    """
+    template_key = MODERATION_EMAIL_TEMPLATES.get(moderation_status)
+    if not template_key:
+        return 0
+
+    tpl = EmailTemplate.objects.get(key=template_key)
+    body = Template(tpl.body)
+
+    reviews = (
+        Review.objects
+        .filter(id__in=review_ids, user__isnull=False)
+        .exclude(user__email="")
+        .select_related("user")
+    )
+
+    sent = 0
+    failed = []
+
+    connection = get_connection(fail_silently=False)
+    # Open explicitly; otherwise every send() opens and closes its own
+    connection.open()
+    try:
+        for review in reviews:
+            message = EmailMessage(
+                subject=tpl.subject,
+                body=body.render(Context({"username": review.user.username})),
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                to=[review.user.email],
+                connection=connection,
+            )
+            try:
+                message.send()
+            except Exception:
+                failed.append(review.id)
+                # The session may be broken; start a fresh one for the
+                # remaining messages
+                _close_quietly(connection)
+                with suppress(Exception):
+                    connection.open()
+            else:
+                sent += 1
+    finally:
+        _close_quietly(connection)
+
+    if failed:
+        raise self.retry(
+            kwargs={"review_ids": failed, "moderation_status": moderation_status},
+            countdown=30 * 2 ** self.request.retries,
+        )
+
+    return sent
@@ -1,3 +1,101 @@
-from django.test import TestCase
+import shutil
+import tempfile
 
-# Create your tests here.
+from django.contrib.contenttypes.models import ContentType
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from auth_app.models import User
+from blog.models import BlogPost
+from company.models import Company
+from review.models import Review, ReviewMedia, ReviewReply
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class PublicReviewQueryCountTests(APITestCase):
+    """
+    Public review listings must cost a fixed number of queries,
+    whatever the page size.
+    """
+
+    REVIEWS = 12
+    MAX_QUERIES = 6
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(
+            email="owner@example.com", username="owner", password="pass12345"
+        )
+        cls.company = Company.objects.create(name="Acme Migration")
+        cls.blog = BlogPost.objects.create(
+            title="Moving abroad",
+            slug="moving-abroad",
+            author=cls.owner,
+            content="<p>Hello</p>",
+            status=BlogPost.Status.PUBLISHED,
+        )
+
+        for target in (cls.company, cls.blog):
+            content_type = ContentType.objects.get_for_model(target)
+
+            for i in range(cls.REVIEWS):
+                author = User.objects.get_or_create(
+                    email=f"author{i}@example.com",
+                    defaults={"username": f"author{i}"},
+                )[0]
+
+                review = Review.objects.create(
+                    content_type=content_type,
+                    object_id=target.id,
+                    rating=(i % 5) + 1,
+                    body=f"Review {i}",
+                    author_name=author.username,
+                    user=author,
+                    moderation_status=Review.ModerationStatus.APPROVED,
+                )
+                ReviewReply.objects.create(
+                    review=review, author=cls.owner, body="Thanks"
+                )
+                ReviewMedia.objects.create(
+                    review=review,
+                    file=SimpleUploadedFile(f"photo{i}.jpg", b"img"),
+                    media_type="image",
+                )
+
+    def assertConstantQueries(self, url, **params):
+        counts = []
+
+        for page_size in (2, self.REVIEWS):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(url, {"page_size": page_size, **params})
+
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.data["results"]), page_size)
+            counts.append(len(ctx.captured_queries))
+
+        self.assertEqual(counts[0], counts[1])
+        self.assertLessEqual(counts[1], self.MAX_QUERIES)
+
+    def test_company_reviews(self):
+        self.assertConstantQueries(f"/api/company/{self.company.slug}/reviews/")
+
+    def test_company_reviews_cursor(self):
+        self.assertConstantQueries(
+            f"/api/company/{self.company.slug}/reviews/", cursor=""
+        )
+
+    def test_blog_reviews(self):
+        self.assertConstantQueries(f"/api/blog/{self.blog.slug}/reviews/")
+
+    def test_blog_reviews_cursor(self):
+        self.assertConstantQueries(f"/api/blog/{self.blog.slug}/reviews/", cursor="")
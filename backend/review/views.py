@@ -8,9 +8,8 @@ from django.db import transaction
 from django.utils import timezone
 from review.models import Review, ReviewReply
 from review.permissions import can_moderate_review
-from review.utils import get_company_from_review
-from company.utils import recalculate_company_rating
-from company.models import Company, CompanyMembership
+from company.models import Company
+from company.permissions import user_can_manage_company
 
 from .serializers import (
     ReviewReplySerializer,
@@ -42,29 +41,26 @@ class ApproveReviewView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        is_allowed = CompanyMembership.objects.filter(
-            user=request.user,
-            company=company,
-            role__in=["OWNER", "MANAGER"],
-            status="ACTIVE",
-        ).exists()
-
-        if not is_allowed:
+        if not user_can_manage_company(request.user, company):
             return Response(
                 {"detail": "Not allowed"},
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        if review.moderation_status == Review.ModerationStatus.APPROVED:
-            return Response(
-                {"detail": "Review already approved"},
-                status=status.HTTP_200_OK,
-            )
-
         with transaction.atomic():
+            # Lock the row and re-read its status, so concurrent moderation
+            # of the same review can't apply the rating delta twice
+            review = Review.objects.select_for_update().get(pk=review.pk)
+
+            if review.moderation_status == Review.ModerationStatus.APPROVED:
+                return Response(
+                    {"detail": "Review already approved"},
+                    status=status.HTTP_200_OK,
+                )
+
             review.moderation_status = Review.ModerationStatus.APPROVED
+            # post_save applies the rating delta to the company
             review.save(update_fields=["moderation_status", "updated_at"])
-            recalculate_company_rating(company)
 
         if review.user_id:
             send_review_approved_email.delay(
@@ -90,19 +86,21 @@ class RejectReviewView(APIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        if review.moderation_status == Review.ModerationStatus.REJECTED:
-            return Response(
-                {"detail": "Review already rejected"},
-                status=status.HTTP_200_OK,
-            )
-
         with transaction.atomic():
+            # Lock the row and re-read its status, so concurrent moderation
+            # of the same review can't apply the rating delta twice
+            review = Review.objects.select_for_update().get(pk=review.pk)
+
+            if review.moderation_status == Review.ModerationStatus.REJECTED:
+                return Response(
+                    {"detail": "Review already rejected"},
+                    status=status.HTTP_200_OK,
+                )
+
             review.moderation_status = Review.ModerationStatus.REJECTED
+            # post_save applies the rating delta to the company
             review.save(update_fields=["moderation_status", "updated_at"])
 
-            company = get_company_from_review(review)
-            recalculate_company_rating(company)
-
         if review.user_id:
             send_review_rejected_email.delay(
                 user_id=review.user_id,
@@ -197,27 +195,29 @@ class CompanyReviewUpdateAPIView(APIView):
 
         content_type = ContentType.objects.get_for_model(Company)
 
-        review = get_object_or_404(
-            Review,
-            content_type=content_type,
-            object_id=company.id,
-            user=request.user,
-        )
+        with transaction.atomic():
+            # Locked, so the rating delta is computed against the current
+            # status even if a moderator acts at the same time
+            review = get_object_or_404(
+                Review.objects.select_for_update(),
+                content_type=content_type,
+                object_id=company.id,
+                user=request.user,
+            )
 
-        serializer = ReviewUpdateSerializer(
-            review,
-            data=request.data,
-            partial=True,
-            context={"request": request},
-        )
-        serializer.is_valid(raise_exception=True)
+            serializer = ReviewUpdateSerializer(
+                review,
+                data=request.data,
+                partial=True,
+                context={"request": request},
+            )
+            serializer.is_valid(raise_exception=True)
 
-        delete_media_ids = serializer.validated_data.pop(
-            "delete_media_ids",
-            []
-        )
+            delete_media_ids = serializer.validated_data.pop(
+                "delete_media_ids",
+                []
+            )
 
-        with transaction.atomic():
             # 🔁 Update review content
             serializer.save(
                 moderation_status=Review.ModerationStatus.PENDING,